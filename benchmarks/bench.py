@@ -0,0 +1,261 @@
+# Benchmark suite: python -m benchmarks.bench [--sizes small,medium,large,huge]
+# Generates synthetic Blockbench models (kept in temp/bench), times each case,
+# prints JSON with throughput and peak RSS and compares against
+# benchmarks/baseline.json (--save-baseline rewrites it). The committed
+# baseline is a reference run of the default sizes; timings depend on the
+# machine, so re-save it on the machine that tracks regressions.
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import platform
+import multiprocessing
+from benchmarks.obj_generator import generate_obj, parse_size
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+STUB_BLENDER = os.path.join(REPO_DIR, "logic", "blender_stub.py")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+WORK_DIR = os.path.join(REPO_DIR, "temp", "bench")
+
+SIZES = {"small": "256KB", "medium": "16MB", "large": "256MB", "huge": "1GB"}
+DEFAULT_SIZES = ("small", "medium")
+DEFAULT_TOLERANCE = 0.25
+# Differences below these are timer and allocator noise, whatever the ratio.
+NOISE_FLOORS = {"seconds": 0.005, "peak_rss": 4 * 1024 * 1024}
+MODEL_SIZE_SLACK = 16 * 1024
+
+# === Peak RSS ===
+def peak_rss():
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_rss()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _windows_peak_rss():
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return None
+    return counters.PeakWorkingSetSize
+
+# === Cases ===
+# Each case prepares its inputs untimed in a scratch dir, then returns
+# (seconds, units, unit name) for the timed call.
+def group_names_of(obj_path):
+    names = set()
+    with open(obj_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith("o "):
+                names.add(line[2:].strip())
+    return sorted(names)
+
+def case_deduplicate_obj(model, scratch):
+    from logic.converter_core import deduplicate_obj
+    path = shutil.copy(model, scratch)
+    started = time.perf_counter()
+    deduplicate_obj(path)
+    return time.perf_counter() - started, os.path.getsize(model) / 1e6, "MB"
+
+def case_update_mtllib_reference(model, scratch):
+    from logic.converter_core import update_mtllib_reference
+    path = shutil.copy(model, scratch)
+    started = time.perf_counter()
+    update_mtllib_reference(path, "renamed.mtl")
+    return time.perf_counter() - started, os.path.getsize(model) / 1e6, "MB"
+
+def case_write_java_class(model, scratch):
+    from logic.converter_core import normalize_group_name, write_java_class
+    names = sorted({normalize_group_name(name) for name in group_names_of(model)})
+    started = time.perf_counter()
+    write_java_class("ModelGroups", names, scratch)
+    return time.perf_counter() - started, len(names), "groups"
+
+def _process(model, scratch, engine, enable_hbm=False):
+    from logic.converter_core import process_obj_file
+    started = time.perf_counter()
+    process_obj_file(model, os.path.join(scratch, "out"), java_class="ModelGroups",
+                     logger=lambda message: None, output_name="model", engine=engine,
+                     enable_hbm=enable_hbm)
+    return time.perf_counter() - started, os.path.getsize(model) / 1e6, "MB"
+
+def case_process_obj_file(model, scratch):
+    return _process(model, scratch, "blender")
+
+def case_process_obj_file_native(model, scratch):
+    return _process(model, scratch, "native")
+
+# HBM mode runs the native weld, triangulate and orient stages.
+def case_process_obj_file_native_hbm(model, scratch):
+    return _process(model, scratch, "native", enable_hbm=True)
+
+CASES = {
+    "deduplicate_obj": case_deduplicate_obj,
+    "update_mtllib_reference": case_update_mtllib_reference,
+    "write_java_class": case_write_java_class,
+    "process_obj_file": case_process_obj_file,
+    "process_obj_file[native]": case_process_obj_file_native,
+    "process_obj_file[native-hbm]": case_process_obj_file_native_hbm,
+}
+
+# === Runner ===
+# Every repetition runs in a fresh interpreter so peak RSS belongs to that
+# case alone, and Blender is swapped for logic/blender_stub.py before any
+# logic module is imported.
+def _run_in_child(case, model, connection):
+    os.environ["OBJ_FIXER_BLENDER"] = STUB_BLENDER
+    scratch = tempfile.mkdtemp(prefix="bench_")
+    try:
+        seconds, units, unit = CASES[case](model, scratch)
+        connection.send({"seconds": seconds, "units": units, "unit": unit, "peak_rss": peak_rss()})
+    except Exception as e:
+        connection.send({"error": f"{type(e).__name__}: {e}"})
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+        connection.close()
+
+def run_case(case, model, repeat):
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    for _ in range(repeat):
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_run_in_child, args=(case, model, sender))
+        process.start()
+        sender.close()
+        try:
+            run = receiver.recv()
+        except EOFError:
+            run = {"error": "benchmark process exited with code " + str(process.join() or process.exitcode)}
+        process.join()
+        if "error" in run:
+            return {"error": run["error"]}
+        runs.append(run)
+
+    seconds = min(run["seconds"] for run in runs)
+    peaks = [run["peak_rss"] for run in runs if run["peak_rss"] is not None]
+    return {
+        "seconds": round(seconds, 6),
+        "runs": [round(run["seconds"], 6) for run in runs],
+        "throughput": round(runs[0]["units"] / max(seconds, 1e-9), 3),
+        "throughput_unit": runs[0]["unit"] + "/s",
+        "peak_rss": max(peaks) if peaks else None,
+    }
+
+# The generator stops at the first cube past the target, so a kept model
+# more than a few cubes off its size is stale and is generated again.
+def prepare_model(size_name, work_dir):
+    path = os.path.join(work_dir, f"bench_{size_name}.obj")
+    target = parse_size(SIZES[size_name])
+    if not os.path.exists(path) or not target <= os.path.getsize(path) < target + MODEL_SIZE_SLACK:
+        print(f"Generating {size_name} model ({SIZES[size_name]})...", file=sys.stderr)
+        generate_obj(path, target_bytes=target)
+    return path
+
+def run_suite(sizes, cases, repeat, work_dir):
+    os.makedirs(work_dir, exist_ok=True)
+    results = {}
+    for size_name in sizes:
+        model = prepare_model(size_name, work_dir)
+        for case in cases:
+            key = f"{size_name}/{case}"
+            result = run_case(case, model, repeat)
+            result["input_bytes"] = os.path.getsize(model)
+            results[key] = result
+            if "error" in result:
+                print(f"{key:45} error: {result['error']}", file=sys.stderr)
+            else:
+                rss = f"{result['peak_rss'] / 1e6:8.1f} MB" if result["peak_rss"] else "       n/a"
+                print(f"{key:45} {result['seconds']:9.4f}s {result['throughput']:12.1f} "
+                      f"{result['throughput_unit']:9} peak {rss}", file=sys.stderr)
+    return results
+
+# === Baseline Comparison ===
+def compare(results, baseline, tolerance):
+    regressions = []
+    for key, result in results.items():
+        before = baseline.get("results", {}).get(key)
+        if not before or "error" in result or "error" in before:
+            continue
+        for metric in ("seconds", "peak_rss"):
+            if result.get(metric) and before.get(metric):
+                ratio = result[metric] / before[metric]
+                result[metric + "_vs_baseline"] = round(ratio, 3)
+                if ratio > 1 + tolerance and result[metric] - before[metric] >= NOISE_FLOORS[metric]:
+                    regressions.append(f"{key}: {metric} {ratio:.2f}x baseline")
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench",
+        description="Time the OBJ fixer pipeline on synthetic Blockbench models, with Blender stubbed out.")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES),
+                        help="comma-separated model sizes from: " + ", ".join(
+                            f"{name} ({size})" for name, size in SIZES.items()))
+    parser.add_argument("--cases", default=",".join(CASES), help="comma-separated cases to run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the fastest is reported")
+    parser.add_argument("--work-dir", default=WORK_DIR, help="where generated models are kept between runs")
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown or memory growth before a case counts as a regression")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [size for size in args.sizes.split(",") if size]
+    cases = [case for case in args.cases.split(",") if case]
+    unknown = [name for name in sizes if name not in SIZES] + [name for name in cases if name not in CASES]
+    if unknown:
+        print("Unknown size or case: " + ", ".join(unknown), file=sys.stderr)
+        return 2
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "results": run_suite(sizes, cases, max(1, args.repeat), args.work_dir),
+    }
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(report["results"], json.load(f), args.tolerance)
+        report["regressions"] = regressions
+        for regression in regressions:
+            print("⚠️ Regression: " + regression, file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+        print("Baseline saved to: " + args.baseline, file=sys.stderr)
+
+    failed = any("error" in result for result in report["results"].values())
+    return 1 if regressions or failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
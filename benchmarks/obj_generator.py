@@ -0,0 +1,115 @@
+import os
+import sys
+import random
+import argparse
+
+# === Synthetic Blockbench OBJ Generator ===
+# Writes models shaped like Blockbench's OBJ export: one `o` per cube with 8
+# positions, 24 UVs, 6 normals and 6 quads, global indices and an mtllib line.
+# Cube names repeat and sometimes carry Blender-style `.001` suffixes, so the
+# group renaming paths get real work to do.
+CUBE_NAMES = ("body", "head", "arm_left", "arm_right", "leg_left", "leg_right",
+              "barrel", "wheel", "door", "hatch", "antenna", "bolt")
+CUBE_CORNERS = ((1, 1, 1), (1, 1, 0), (1, 0, 1), (1, 0, 0),
+                (0, 1, 0), (0, 1, 1), (0, 0, 0), (0, 0, 1))
+CUBE_QUADS = ((0, 2, 3, 1), (4, 6, 7, 5), (4, 5, 0, 1), (7, 6, 3, 2), (5, 7, 2, 0), (1, 3, 6, 4))
+CUBE_NORMALS = ((1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1))
+MATERIAL_COUNT = 4
+NAME_REPEATS = 4
+BATCH_CUBES = 2048
+
+SIZE_UNITS = {"kb": 1 << 10, "mb": 1 << 20, "gb": 1 << 30}
+
+def parse_size(text):
+    text = str(text).strip().lower()
+    for unit, factor in SIZE_UNITS.items():
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * factor)
+    return int(text)
+
+def cube_name(rng, index, duplicate_ratio):
+    # Every base name is shared by NAME_REPEATS cubes, so names repeat as in
+    # real exports while the number of distinct groups grows with the model.
+    name = f"{CUBE_NAMES[index % len(CUBE_NAMES)]}_{index // (len(CUBE_NAMES) * NAME_REPEATS)}"
+    if rng.random() < duplicate_ratio:
+        return f"{name}.{rng.randint(1, 20):03d}"
+    return name
+
+def cube_block(rng, index, duplicate_ratio):
+    x, y, z = rng.uniform(-16, 16), rng.uniform(0, 32), rng.uniform(-16, 16)
+    w, h, d = rng.uniform(0.5, 8), rng.uniform(0.5, 8), rng.uniform(0.5, 8)
+    v_base, vt_base, vn_base = index * 8, index * 24, index * 6
+
+    lines = [f"o {cube_name(rng, index, duplicate_ratio)}\n"]
+    for cx, cy, cz in CUBE_CORNERS:
+        lines.append("v %.6f %.6f %.6f\n" % ((x + cx * w) / 16, (y + cy * h) / 16, (z + cz * d) / 16))
+    for _ in range(6):
+        u, v = rng.random() * 0.9, rng.random() * 0.9
+        lines.append("vt %.6f %.6f\nvt %.6f %.6f\nvt %.6f %.6f\nvt %.6f %.6f\n"
+                     % (u, v + 0.1, u, v, u + 0.1, v, u + 0.1, v + 0.1))
+    for normal in CUBE_NORMALS:
+        lines.append("vn %d %d %d\n" % normal)
+    lines.append(f"usemtl m_{index % MATERIAL_COUNT}\n")
+    for face, quad in enumerate(CUBE_QUADS):
+        tokens = [f"{v_base + corner + 1}/{vt_base + face * 4 + k + 1}/{vn_base + face + 1}"
+                  for k, corner in enumerate(quad)]
+        lines.append("f " + " ".join(tokens) + "\n")
+    return "".join(lines)
+
+def write_mtl(mtl_path):
+    with open(mtl_path, 'w', encoding='utf-8') as f:
+        f.write("# Made in Blockbench\n")
+        for index in range(MATERIAL_COUNT):
+            f.write(f"newmtl m_{index}\nmap_Kd texture_{index}.png\n")
+
+def generate_obj(obj_path, cubes=None, target_bytes=None, duplicate_ratio=0.3, seed=0):
+    if cubes is None and target_bytes is None:
+        raise ValueError("Either cubes or target_bytes is required.")
+    rng = random.Random(seed)
+    mtl_name = os.path.splitext(os.path.basename(obj_path))[0] + ".mtl"
+    os.makedirs(os.path.dirname(os.path.abspath(obj_path)), exist_ok=True)
+    write_mtl(os.path.join(os.path.dirname(os.path.abspath(obj_path)), mtl_name))
+
+    written = 0
+    index = 0
+    with open(obj_path, 'w', encoding='utf-8', newline='\n') as f:
+        header = f"# Made in Blockbench 4.9.4\nmtllib {mtl_name}\n\n"
+        f.write(header)
+        written += len(header)
+        while True:
+            batch = BATCH_CUBES if cubes is None else min(BATCH_CUBES, cubes - index)
+            if batch <= 0:
+                break
+            # Cubes are written in batches but the size target is checked per
+            # cube, so small targets are not rounded up to a whole batch.
+            blocks = []
+            for i in range(batch):
+                blocks.append(cube_block(rng, index + i, duplicate_ratio))
+                written += len(blocks[-1])
+                if target_bytes is not None and written >= target_bytes:
+                    break
+            f.write("".join(blocks))
+            index += len(blocks)
+            if target_bytes is not None and written >= target_bytes:
+                break
+    return {"path": obj_path, "cubes": index, "bytes": os.path.getsize(obj_path)}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.obj_generator",
+                                     description="Write a synthetic Blockbench-style OBJ model.")
+    parser.add_argument("output", help="path of the .obj to write (an .mtl is written next to it)")
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument("--cubes", type=int, help="number of cubes")
+    size.add_argument("--size", help="approximate file size, e.g. 500KB, 20MB, 1GB")
+    parser.add_argument("--duplicates", type=float, default=0.3,
+                        help="share of cubes given a .NNN suffix (default 0.3)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    info = generate_obj(args.output, cubes=args.cubes,
+                        target_bytes=parse_size(args.size) if args.size else None,
+                        duplicate_ratio=args.duplicates, seed=args.seed)
+    print(f"Wrote {info['cubes']} cube(s), {info['bytes'] / 1e6:.1f} MB to {info['path']}")
+
+if __name__ == "__main__":
+    sys.exit(main())
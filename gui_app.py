@@ -5,15 +5,28 @@ from tkinter import filedialog, messagebox, ttk
 from tkinterdnd2 import TkinterDnD
 import threading
 import subprocess
-
-# Force check Blender availability early
-try:
-    from logic.blender_cleaner import run_blender_cleaner, BLENDER_PATH, prompt_blender_missing
-    if not os.path.isfile(BLENDER_PATH):
-        prompt_blender_missing()
-except Exception as e:
-    messagebox.showerror("Fatal Error", f"Error while checking Blender: {e}")
-    sys.exit(1)
+import queue
+import time
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+
+LOG_POLL_MS = 50
+LOG_BATCH_MESSAGES = 500
+LOG_HISTORY_LINES = 5000
+LIST_ROW_HEIGHT = 36
+ERROR_LINES_SHOWN = 25
+JOB_TIMEOUT_SECONDS = 30 * 60  # a hung Blender run is killed after this long
+TREE_PLACEHOLDER = "|loading"  # '|' never appears in a real path, so this iid is unique
+
+# Checked at launch rather than import time, so importing this module stays cheap
+def check_blender():
+    try:
+        from logic.blender_cleaner import BLENDER_PATH, prompt_blender_missing
+        if not os.path.isfile(BLENDER_PATH):
+            prompt_blender_missing()
+    except Exception as e:
+        messagebox.showerror("Fatal Error", f"Error while checking Blender: {e}")
+        sys.exit(1)
 
 def check_dependencies():
     try:
@@ -38,14 +51,38 @@ class OBJFixerGUI(TkinterDnD.Tk):
         self.geometry("1000x700")
         self.configure(bg="#1a1a1a")
 
-        self.selected_files = []
+        # Input files in display order: path -> typed names, selection and
+        # which fields failed validation. Only the visible rows have widgets.
+        self.files = {}
+        self.file_order = []
+        self.file_rows = []
+        self.visible_rows = 1
+        self.list_offset = 0
+        self.select_all = ctk.BooleanVar(value=False)
         self.output_dir = None
-        self.entry_boxes = []
         self.create_java = ctk.BooleanVar(value=True)
         self.create_txt = ctk.BooleanVar(value=False)
+        self.write_index = ctk.BooleanVar(value=False)
+        self.compact_obj = ctk.BooleanVar(value=False)
         self.enable_hbm = ctk.BooleanVar(value=False)
+        self.use_cache = ctk.BooleanVar(value=True)
+        self.engine = ctk.StringVar(value="blender")
+        self.worker_count = ctk.StringVar(value=str(max(1, (os.cpu_count() or 1) - 1)))
+        self.watch_stop = None
+        # Worker threads never touch widgets: they queue log lines and UI calls,
+        # and the main loop drains the queue in batches.
+        self.ui_queue = queue.Queue()
+        self.log_lines = 0
+        self.progress = None
+        self.cancel_event = None
+        self.job_cancel_events = {}  # input path -> Event, for the running batch
+        # Output tree nodes use their full path as iid; folders are listed on
+        # a background thread only once expanded.
+        self.tree_executor = ThreadPoolExecutor(max_workers=1)
+        self.tree_loaded = set()
 
         self.setup_widgets()
+        self.after(LOG_POLL_MS, self.drain_ui_queue)
 
     def setup_widgets(self):
         main = ctk.CTkFrame(self, fg_color="#1a1a1a")
@@ -55,8 +92,9 @@ class OBJFixerGUI(TkinterDnD.Tk):
 
         self.file_input_frame_border = ctk.CTkFrame(main, fg_color="#1a1a1a", border_color="#1a1a1a", border_width=2)
         self.file_input_frame_border.grid(row=1, column=0, columnspan=2, sticky='nsew', padx=5, pady=5)
-        self.file_input_frame = ctk.CTkScrollableFrame(self.file_input_frame_border)
-        self.file_input_frame.pack(fill='both', expand=True)
+        self.file_input_frame = ctk.CTkFrame(self.file_input_frame_border)
+        self.file_input_frame.pack(fill='both', expand=True, padx=2, pady=2)
+        self.build_file_list(self.file_input_frame)
 
         self.preview_wrapper_border = ctk.CTkFrame(main, fg_color="#1a1a1a", border_color="#1a1a1a", border_width=2)
         self.preview_wrapper_border.grid(row=1, column=2, sticky='nsew', padx=5, pady=5)
@@ -73,11 +111,15 @@ class OBJFixerGUI(TkinterDnD.Tk):
 
         self.output_tree = ttk.Treeview(self.preview_wrapper, show='tree')
         self.output_tree.pack(fill='both', expand=True)
+        self.output_tree.bind("<<TreeviewOpen>>", self.on_tree_open)
 
         self.left_btn_frame = ctk.CTkFrame(main, fg_color="transparent")
         self.left_btn_frame.grid(row=0, column=0, columnspan=2, sticky="n", pady=10)
         self.browse_btn = ctk.CTkButton(self.left_btn_frame, text="Browse .OBJ Files", command=self.browse_files, border_width=2)
-        self.browse_btn.pack()
+        self.browse_btn.pack(side="left")
+        ctk.CTkButton(self.left_btn_frame, text="Add Folder", command=self.browse_folder, border_width=2).pack(side="left", padx=(6, 0))
+        self.watch_btn = ctk.CTkButton(self.left_btn_frame, text="Watch Folder", command=self.toggle_watch, border_width=2)
+        self.watch_btn.pack(side="left", padx=6)
 
         self.right_btn_frame = ctk.CTkFrame(main, fg_color="transparent")
         self.right_btn_frame.grid(row=0, column=2, sticky="n", pady=10)
@@ -90,83 +132,436 @@ class OBJFixerGUI(TkinterDnD.Tk):
         toggle_frame.grid(row=2, column=0, sticky='n', pady=5)
         ctk.CTkCheckBox(toggle_frame, text="Generate Java Class", variable=self.create_java, command=self.toggle_txt_option).pack(anchor='w', padx=20)
         ctk.CTkCheckBox(toggle_frame, text="Generate .txt Groupings", variable=self.create_txt).pack(anchor='w', padx=20, pady=5)
+        ctk.CTkCheckBox(toggle_frame, text="Write Group Index", variable=self.write_index).pack(anchor='w', padx=20, pady=5)
+        ctk.CTkCheckBox(toggle_frame, text="Compact OBJ", variable=self.compact_obj).pack(anchor='w', padx=20, pady=5)
         ctk.CTkCheckBox(toggle_frame, text="HBM Conversion Mode", variable=self.enable_hbm).pack(anchor='w', padx=20, pady=5)
+        ctk.CTkCheckBox(toggle_frame, text="Use Conversion Cache", variable=self.use_cache).pack(anchor='w', padx=20, pady=5)
+        engine_row = ctk.CTkFrame(toggle_frame, fg_color="transparent")
+        engine_row.pack(anchor='w', padx=20, pady=5)
+        ctk.CTkLabel(engine_row, text="Engine").pack(side='left', padx=(0, 8))
+        ctk.CTkOptionMenu(engine_row, variable=self.engine, values=["blender", "worker", "native"], width=110).pack(side='left')
+        ctk.CTkLabel(engine_row, text="Jobs").pack(side='left', padx=(12, 8))
+        ctk.CTkOptionMenu(engine_row, variable=self.worker_count,
+                          values=[str(n) for n in range(1, (os.cpu_count() or 1) + 1)], width=60).pack(side='left')
 
         ctk.CTkButton(main, text="Run Conversion", height=40, font=("Arial", 18), command=self.run_conversion).grid(row=2, column=1, pady=10)
         self.log_box = ctk.CTkTextbox(main, height=150)
         self.log_box.grid(row=3, column=0, columnspan=3, sticky='nsew', padx=5, pady=5)
 
+        progress_frame = ctk.CTkFrame(main, fg_color="transparent")
+        progress_frame.grid(row=4, column=0, columnspan=3, sticky='ew', padx=5, pady=(0, 5))
+        self.progress_bar = ctk.CTkProgressBar(progress_frame)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(side='left', fill='x', expand=True, padx=(0, 10))
+        self.progress_label = ctk.CTkLabel(progress_frame, text="Idle", width=320, anchor='e')
+        self.progress_label.pack(side='left')
+        self.cancel_btn = ctk.CTkButton(progress_frame, text="Cancel", width=80, state="disabled", command=self.cancel_conversion)
+        self.cancel_btn.pack(side='left', padx=(10, 0))
+        self.cancel_selected_btn = ctk.CTkButton(progress_frame, text="Cancel Selected", width=120, state="disabled",
+                                                 command=self.cancel_selected)
+        self.cancel_selected_btn.pack(side='left', padx=(10, 0))
+
     def toggle_txt_option(self):
         if self.create_java.get():
             self.create_txt.set(False)
-        for _, java_field, _ in self.entry_boxes:
-            java_field.configure(state="normal" if self.create_java.get() else "disabled")
-            if not self.create_java.get():
-                java_field.configure(border_color="#3a3a3a")
-
-    def refresh_fields(self):
-        for widget in self.file_input_frame.winfo_children():
-            widget.destroy()
-        self.entry_boxes.clear()
-
-        for file in self.selected_files:
-            filename = os.path.basename(file)
-            row = ctk.CTkFrame(self.file_input_frame)
-            row.pack(fill='x', padx=2, pady=2)
-
-            ctk.CTkLabel(row, text=filename, width=160, anchor='w').pack(side='left', padx=5)
-            model_name = ctk.CTkEntry(row, placeholder_text="Model Output Name", border_width=2)
-            model_name.pack(side='left', fill='x', expand=True, padx=(5, 5))
-            java_field = ctk.CTkEntry(row, placeholder_text="Java Class Name", border_width=2)
-            java_field.pack(side='left', fill='x', expand=True)
-            remove_button = ctk.CTkButton(row, text="❌", width=30, command=lambda f=file: self.remove_file(f))
-            remove_button.pack(side='left', padx=5)
-
-            model_name.bind("<KeyRelease>", lambda e, entry=model_name: entry.configure(border_color="#3a3a3a"))
-            java_field.bind("<KeyRelease>", lambda e, entry=java_field: entry.configure(border_color="#3a3a3a"))
-
-            self.entry_boxes.append((file, java_field, model_name))
-        self.toggle_txt_option()
+        self.render_file_list()
+
+    # === Virtualized File List ===
+    def build_file_list(self, parent):
+        toolbar = ctk.CTkFrame(parent, fg_color="transparent")
+        toolbar.pack(fill='x', padx=2, pady=(2, 0))
+        ctk.CTkCheckBox(toolbar, text="", width=28, variable=self.select_all, command=self.toggle_select_all).pack(side='left', padx=(5, 0))
+        self.file_count_label = ctk.CTkLabel(toolbar, text="No files", width=160, anchor='w')
+        self.file_count_label.pack(side='left', padx=5)
+        ctk.CTkButton(toolbar, text="Remove Selected", width=120, command=self.remove_selected).pack(side='right', padx=5)
+        ctk.CTkButton(toolbar, text="Auto-Fill Names", width=120, command=self.auto_fill_names).pack(side='right')
+
+        # Column headers stand in for the entries' placeholders, which CTk
+        # hides while a textvariable is bound. Spacers match the row layout.
+        header = ctk.CTkFrame(parent, fg_color="transparent")
+        header.pack(fill='x', padx=(4, 20), pady=(2, 0))
+        ctk.CTkLabel(header, text="", width=28).pack(side='left', padx=(5, 0))
+        ctk.CTkLabel(header, text="File", width=160, anchor='w').pack(side='left', padx=5)
+        ctk.CTkLabel(header, text="Model Output Name", anchor='w').pack(side='left', fill='x', expand=True, padx=(5, 5))
+        ctk.CTkLabel(header, text="Java Class Name", anchor='w').pack(side='left', fill='x', expand=True)
+        ctk.CTkLabel(header, text="", width=30).pack(side='left', padx=5)
+
+        body = ctk.CTkFrame(parent, fg_color="transparent")
+        body.pack(fill='both', expand=True)
+        self.file_scrollbar = ctk.CTkScrollbar(body, command=self.scroll_file_list)
+        self.file_scrollbar.pack(side='right', fill='y')
+        self.file_rows_frame = ctk.CTkFrame(body, fg_color="transparent")
+        self.file_rows_frame.pack(side='left', fill='both', expand=True)
+        self.file_rows_frame.columnconfigure(0, weight=1)
+        # The pane decides how many rows fit, not the other way round.
+        self.file_rows_frame.grid_propagate(False)
+        self.file_rows_frame.bind("<Configure>", self.resize_file_list)
+        self.bind_file_list_wheel(self.file_rows_frame)
+
+    def bind_file_list_wheel(self, widget):
+        widget.bind("<MouseWheel>", self.on_file_list_wheel)
+        widget.bind("<Button-4>", self.on_file_list_wheel)
+        widget.bind("<Button-5>", self.on_file_list_wheel)
+
+    def create_file_row(self, index):
+        row = {"path": None, "model": ctk.StringVar(), "java": ctk.StringVar(), "selected": ctk.BooleanVar()}
+        frame = ctk.CTkFrame(self.file_rows_frame, height=LIST_ROW_HEIGHT)
+        frame.grid(row=index, column=0, sticky='ew', padx=2, pady=2)
+        row["frame"] = frame
+        ctk.CTkCheckBox(frame, text="", width=28, variable=row["selected"],
+                        command=lambda: self.on_row_selected(row)).pack(side='left', padx=(5, 0))
+        row["label"] = ctk.CTkLabel(frame, text="", width=160, anchor='w')
+        row["label"].pack(side='left', padx=5)
+        row["model_field"] = ctk.CTkEntry(frame, textvariable=row["model"], border_width=2)
+        row["model_field"].pack(side='left', fill='x', expand=True, padx=(5, 5))
+        row["java_field"] = ctk.CTkEntry(frame, textvariable=row["java"], border_width=2)
+        row["java_field"].pack(side='left', fill='x', expand=True)
+        ctk.CTkButton(frame, text="❌", width=30, command=lambda: self.remove_file(row["path"])).pack(side='left', padx=5)
+
+        row["model_field"].bind("<KeyRelease>", lambda e: self.on_row_edited(row, "model"))
+        row["java_field"].bind("<KeyRelease>", lambda e: self.on_row_edited(row, "java"))
+        self.bind_file_list_wheel(frame)
+        self.bind_file_list_wheel(row["label"])
+        return row
+
+    def resize_file_list(self, event):
+        self.visible_rows = max(1, event.height // (LIST_ROW_HEIGHT + 4))
+        while len(self.file_rows) < self.visible_rows:
+            self.file_rows.append(self.create_file_row(len(self.file_rows)))
+        self.render_file_list()
+
+    def render_file_list(self):
+        total = len(self.file_order)
+        self.list_offset = max(0, min(self.list_offset, total - self.visible_rows))
+        java_state = "normal" if self.create_java.get() else "disabled"
+        for index, row in enumerate(self.file_rows):
+            position = self.list_offset + index
+            if index >= self.visible_rows or position >= total:
+                row["path"] = None
+                row["frame"].grid_remove()
+                continue
+            path = self.file_order[position]
+            entry = self.files[path]
+            row["path"] = path
+            row["label"].configure(text=os.path.basename(path))
+            row["model"].set(entry["model"])
+            row["java"].set(entry["java"])
+            row["selected"].set(entry["selected"])
+            row["model_field"].configure(border_color="red" if "model" in entry["invalid"] else "#3a3a3a")
+            row["java_field"].configure(state=java_state,
+                                        border_color="red" if "java" in entry["invalid"] and self.create_java.get() else "#3a3a3a")
+            row["frame"].grid()
+
+        if total:
+            self.file_scrollbar.set(self.list_offset / total, min(1.0, (self.list_offset + self.visible_rows) / total))
+        else:
+            self.file_scrollbar.set(0, 1)
+        selected = sum(entry["selected"] for entry in self.files.values())
+        text = f"{total} file(s)" + (f", {selected} selected" if selected else "") if total else "No files"
+        self.file_count_label.configure(text=text)
+
+    def scroll_file_list(self, *args):
+        if args[0] == "moveto":
+            self.list_offset = int(float(args[1]) * len(self.file_order))
+        elif args[0] == "scroll":
+            step = int(float(args[1])) * (self.visible_rows if args[2] == "pages" else 1)
+            self.list_offset += step
+        self.render_file_list()
+
+    def on_file_list_wheel(self, event):
+        self.list_offset += -3 if event.num == 4 or event.delta > 0 else 3
+        self.render_file_list()
+        return "break"
+
+    def on_row_edited(self, row, field):
+        entry = self.files.get(row["path"])
+        if entry is None:
+            return
+        entry[field] = row[field].get()
+        entry["invalid"].discard(field)
+        row[field + "_field"].configure(border_color="#3a3a3a")
+
+    def on_row_selected(self, row):
+        entry = self.files.get(row["path"])
+        if entry is not None:
+            entry["selected"] = row["selected"].get()
+        self.render_file_list()
+
+    def toggle_select_all(self):
+        for entry in self.files.values():
+            entry["selected"] = self.select_all.get()
+        self.render_file_list()
+
+    # === Bulk File Operations ===
+    def add_files(self, paths):
+        added = 0
+        for path in paths:
+            path = os.path.normpath(path)
+            if path not in self.files:
+                self.files[path] = {"model": "", "java": "", "selected": False, "invalid": set()}
+                added += 1
+        if added:
+            self.file_order = list(self.files)
+            self.render_file_list()
+        return added
+
+    def remove_paths(self, paths):
+        for path in paths:
+            self.files.pop(path, None)
+        self.file_order = list(self.files)
+        if not self.files:
+            self.select_all.set(False)
+        self.render_file_list()
 
     def browse_files(self):
         self.browse_btn.configure(border_color="#3a3a3a")
         files = filedialog.askopenfilenames(filetypes=[("OBJ files", "*.obj")])
-        for file in files:
-            if file not in self.selected_files:
-                self.selected_files.append(file)
-        self.refresh_fields()
+        self.add_files(files)
+
+    def browse_folder(self):
+        self.browse_btn.configure(border_color="#3a3a3a")
+        directory = filedialog.askdirectory(title="Add every .OBJ file in a folder")
+        if not directory:
+            return
+
+        def scan():
+            found = []
+            for root, dirs, names in os.walk(directory):
+                dirs.sort()
+                found.extend(os.path.join(root, name) for name in sorted(names) if name.lower().endswith(".obj"))
+            self.call_in_ui(self.add_scanned_files, directory, found)
+        self.tree_executor.submit(scan)
+
+    def add_scanned_files(self, directory, paths):
+        added = self.add_files(paths)
+        self.log(f"Added {added} new file(s) from {directory} ({len(paths)} found).")
+
+    def auto_fill_names(self):
+        from logic.watch import java_class_name
+        # Fills only empty fields, in the selection if there is one.
+        selection = any(entry["selected"] for entry in self.files.values())
+        for path, entry in self.files.items():
+            if selection and not entry["selected"]:
+                continue
+            stem = os.path.splitext(os.path.basename(path))[0]
+            if not entry["model"].strip():
+                entry["model"] = stem
+            if not entry["java"].strip():
+                entry["java"] = java_class_name(stem)
+            entry["invalid"].clear()
+        self.render_file_list()
+
+    def remove_selected(self):
+        self.remove_paths([path for path, entry in self.files.items() if entry["selected"]])
 
     def choose_output_dir(self):
         self.folder_btn.configure(border_color="#3a3a3a")
         directory = filedialog.askdirectory()
         if not directory:
             return
-        self.output_dir = directory
+        self.output_dir = os.path.normpath(directory)
         self.preview_wrapper_border.configure(border_color="#1a1a1a")
         self.log(f"Output directory set to: {self.output_dir}")
         self.update_output_preview()
 
+    # === Lazy Output Tree ===
     def update_output_preview(self):
         self.output_tree.delete(*self.output_tree.get_children())
+        self.tree_loaded.clear()
         folder_name = os.path.basename(self.output_dir) if self.output_dir else "(No Output Folder)"
         self.output_tree_label.configure(text=f"Folder Selected: {folder_name}")
-        def insert_node(parent, path):
-            for item in sorted(os.listdir(path)):
-                full_path = os.path.join(path, item)
-                node = self.output_tree.insert(parent, 'end', text=item, open=False)
-                if os.path.isdir(full_path):
-                    insert_node(node, full_path)
         if self.output_dir:
-            insert_node('', self.output_dir)
+            self.list_tree_dir(self.output_dir)
+
+    def list_tree_dir(self, path):
+        def scan():
+            try:
+                with os.scandir(path) as entries:
+                    items = sorted((entry.name, entry.is_dir()) for entry in entries)
+            except OSError:
+                items = []
+            self.call_in_ui(self.populate_tree_dir, path, items)
+        self.tree_executor.submit(scan)
+
+    def populate_tree_dir(self, path, items):
+        root = self.output_dir
+        if not root or (path != root and not self.output_tree.exists(path)):
+            return  # output folder changed or node removed while listing
+        parent = '' if path == root else path
+        self.tree_loaded.add(path)
+
+        wanted = set()
+        for index, (name, is_dir) in enumerate(items):
+            child = os.path.join(path, name)
+            wanted.add(child)
+            if self.output_tree.exists(child):
+                self.output_tree.move(child, parent, index)
+                continue
+            self.output_tree.insert(parent, index, iid=child, text=name, open=False)
+            if is_dir:
+                self.output_tree.insert(child, 'end', iid=child + TREE_PLACEHOLDER, text="…")
+        for child in self.output_tree.get_children(parent):
+            if child not in wanted:
+                self.forget_tree_node(child)
+
+    def forget_tree_node(self, node):
+        prefix = node + os.sep
+        self.tree_loaded = {path for path in self.tree_loaded if path != node and not path.startswith(prefix)}
+        self.output_tree.delete(node)
+
+    def on_tree_open(self, event):
+        node = self.output_tree.focus()
+        if node and node not in self.tree_loaded and self.output_tree.exists(node + TREE_PLACEHOLDER):
+            self.list_tree_dir(node)
+
+    def refresh_tree_paths(self, paths):
+        # A converted folder is added to its parent on its own instead of
+        # re-listing the parent, which for the output root can hold thousands
+        # of model folders. Folders already expanded are re-listed.
+        if not self.output_dir:
+            return
+        root = os.path.normpath(self.output_dir)
+        for path in sorted({os.path.normpath(path) for path in paths}):
+            if path in self.tree_loaded:
+                self.list_tree_dir(path)
+            elif os.path.dirname(path) == root or os.path.dirname(path) in self.tree_loaded:
+                self.add_tree_node(path)
+
+    def add_tree_node(self, path):
+        if self.output_tree.exists(path) or not os.path.isdir(path):
+            return
+        parent = os.path.dirname(path)
+        parent = '' if parent == os.path.normpath(self.output_dir) else parent
+        # Siblings are kept in name order, and their iids share the parent's prefix.
+        index = bisect.bisect(self.output_tree.get_children(parent), path)
+        self.output_tree.insert(parent, index, iid=path, text=os.path.basename(path), open=False)
+        self.output_tree.insert(path, 'end', iid=path + TREE_PLACEHOLDER, text="…")
+
+    def toggle_watch(self):
+        if self.watch_stop:
+            self.watch_stop.set()
+            self.watch_stop = None
+            self.watch_btn.configure(text="Watch Folder")
+            self.log("Stopped watching.")
+            return
+
+        if not self.output_dir:
+            self.folder_btn.configure(border_color="red")
+            self.preview_wrapper_border.configure(border_color="red")
+            messagebox.showerror("Validation Error", "No Output Folder selected.")
+            return
+        directory = filedialog.askdirectory(title="Folder to watch for .OBJ exports")
+        if not directory:
+            return
 
+        from logic.watch import FolderWatcher
+        cache = None
+        if self.use_cache.get():
+            from logic.conversion_cache import ConversionCache
+            cache = ConversionCache()
+        # Java class names are derived from each file name in watch mode.
+        watcher = FolderWatcher([directory], self.output_dir, engine=self.engine.get(),
+                                enable_hbm=self.enable_hbm.get(), generate_txt=self.create_txt.get(),
+                                java=self.create_java.get(), write_index=self.write_index.get(),
+                                compact=self.compact_obj.get(), cache=cache,
+                                workers=int(self.worker_count.get()), logger=self.log,
+                                on_result=lambda result: self.call_in_ui(self.refresh_tree_paths, [result["output_dir"]]))
+        self.watch_stop = threading.Event()
+        self.watch_btn.configure(text="Stop Watching")
+        threading.Thread(target=watcher.run, args=(self.watch_stop,), daemon=True).start()
+
+    # === Thread-Safe Log Pump ===
     def log(self, message):
-        self.log_box.insert('end', message + '\n')
+        self.ui_queue.put(message)
+
+    def call_in_ui(self, func, *args):
+        self.ui_queue.put((func, args))
+
+    def drain_ui_queue(self):
+        pending = []
+        try:
+            for _ in range(LOG_BATCH_MESSAGES):
+                item = self.ui_queue.get_nowait()
+                if isinstance(item, str):
+                    pending.append(item + '\n')
+                    continue
+                self.write_log("".join(pending))
+                pending = []
+                func, args = item
+                func(*args)
+        except queue.Empty:
+            pass
+        finally:
+            self.write_log("".join(pending))
+            self.after(LOG_POLL_MS, self.drain_ui_queue)
+
+    def write_log(self, text):
+        if not text:
+            return
+        self.log_box.insert('end', text)
+        # Keep only the newest LOG_HISTORY_LINES lines, dropping the oldest first.
+        self.log_lines += text.count('\n')
+        excess = self.log_lines - LOG_HISTORY_LINES
+        if excess > 0:
+            self.log_box.delete('1.0', f'{excess + 1}.0')
+            self.log_lines -= excess
         self.log_box.see('end')
 
+    # === Batch Progress ===
+    def start_progress(self, paths):
+        sizes = {}
+        for path in paths:
+            try:
+                sizes[path] = os.path.getsize(path)
+            except OSError:
+                sizes[path] = 0
+        self.progress = {"sizes": sizes, "total": len(paths), "done": 0,
+                         "bytes_total": sum(sizes.values()), "bytes_done": 0,
+                         "started": time.perf_counter()}
+        self.progress_bar.set(0)
+        self.progress_label.configure(text=f"0/{len(paths)} files")
+
+    def advance_progress(self, path):
+        progress = self.progress
+        progress["done"] += 1
+        progress["bytes_done"] += progress["sizes"].get(path, 0)
+        elapsed = max(time.perf_counter() - progress["started"], 1e-6)
+        # ETA from byte throughput, since big exports dominate batch time.
+        fraction = progress["bytes_done"] / progress["bytes_total"] if progress["bytes_total"] else \
+            progress["done"] / progress["total"]
+        rate = progress["bytes_done"] / elapsed / 1e6
+        remaining = elapsed * (1 - fraction) / fraction if fraction else 0
+        self.progress_bar.set(min(fraction, 1.0))
+        text = f"{progress['done']}/{progress['total']} files · {rate:.1f} MB/s · {progress['done'] / elapsed:.2f} files/s"
+        if progress["done"] < progress["total"]:
+            text += f" · ETA {int(remaining // 60)}m{int(remaining % 60):02d}s"
+        else:
+            text += f" · done in {elapsed:.1f}s"
+        self.progress_label.configure(text=text)
+
+    def cancel_conversion(self):
+        if self.cancel_event and not self.cancel_event.is_set():
+            self.cancel_event.set()
+            self.cancel_btn.configure(state="disabled")
+            self.cancel_selected_btn.configure(state="disabled")
+            self.log("Cancelling...")
+
+    def finish_cancel_buttons(self):
+        self.cancel_btn.configure(state="disabled")
+        self.cancel_selected_btn.configure(state="disabled")
+        self.job_cancel_events = {}
+
+    def cancel_selected(self):
+        # Cancels only the checked rows' jobs; the rest of the batch keeps going.
+        for path, event in self.job_cancel_events.items():
+            entry = self.files.get(path)
+            if entry and entry["selected"] and not event.is_set():
+                event.set()
+                self.log(f"Cancelling: {path}")
+
     def remove_file(self, path):
-        if path in self.selected_files:
-            self.selected_files.remove(path)
-        self.refresh_fields()
+        if path in self.files:
+            self.remove_paths([path])
 
     def run_conversion(self):
         self.file_input_frame_border.configure(border_color="#1a1a1a")
@@ -175,7 +570,7 @@ class OBJFixerGUI(TkinterDnD.Tk):
         self.folder_btn.configure(border_color="#3a3a3a")
 
         errors = []
-        if not self.entry_boxes:
+        if not self.files:
             self.browse_btn.configure(border_color="red")
             self.file_input_frame_border.configure(border_color="red")
             errors.append("No OBJ files selected.")
@@ -185,60 +580,93 @@ class OBJFixerGUI(TkinterDnD.Tk):
             self.preview_wrapper_border.configure(border_color="red")
             errors.append("No Output Folder selected.")
 
-        for file, java_field, model_field in self.entry_boxes:
-            model_name = model_field.get().strip()
-            java_name = java_field.get().strip()
+        for file, entry in self.files.items():
+            entry["invalid"].clear()
             file_label = os.path.basename(file)
-            if not model_name:
-                model_field.configure(border_color="red")
+            if not entry["model"].strip():
+                entry["invalid"].add("model")
                 errors.append(f"Missing Model Output Name for: {file_label}")
-            else:
-                model_field.configure(border_color="#3a3a3a")
-            if self.create_java.get():
-                if not java_name:
-                    java_field.configure(border_color="red")
-                    errors.append(f"Missing Java Class Name for: {file_label}")
-                else:
-                    java_field.configure(border_color="#3a3a3a")
+            if self.create_java.get() and not entry["java"].strip():
+                entry["invalid"].add("java")
+                errors.append(f"Missing Java Class Name for: {file_label}")
+        self.render_file_list()
 
         if errors:
+            if len(errors) > ERROR_LINES_SHOWN:
+                errors = errors[:ERROR_LINES_SHOWN] + [f"...and {len(errors) - ERROR_LINES_SHOWN} more."]
             messagebox.showerror("Validation Error", "\n".join(errors))
             return
 
         self.log("Starting conversion...")
 
+        cache = None
+        if self.use_cache.get():
+            from logic.conversion_cache import ConversionCache
+            cache = ConversionCache()
+
+        from logic.batch import unique_output_dirs
+        jobs = []
+        output_dirs = unique_output_dirs(self.files, self.output_dir)
+        for (file, entry), output_dir in zip(self.files.items(), output_dirs):
+            jobs.append({
+                "input_path": file,
+                "output_dir": output_dir,
+                "java_class": entry["java"].strip() if self.create_java.get() else None,
+                "generate_txt": self.create_txt.get(),
+                "write_index": self.write_index.get(),
+                "compact": self.compact_obj.get(),
+                "output_name": entry["model"].strip(),
+                "enable_hbm": self.enable_hbm.get(),
+                "engine": self.engine.get(),
+                "cache": cache,
+                "timeout": JOB_TIMEOUT_SECONDS,
+                "cancel_event": threading.Event(),
+            })
+        workers = int(self.worker_count.get())
+        cancel_event = self.cancel_event = threading.Event()
+        self.job_cancel_events = {job["input_path"]: job["cancel_event"] for job in jobs}
+        self.cancel_btn.configure(state="normal")
+        self.cancel_selected_btn.configure(state="normal")
+
+        # Log lines arrive while each job runs, tagged with its file name
+        # since parallel jobs interleave.
+        def job_log(job, message):
+            self.log(f"[{os.path.basename(job['input_path'])}] {message}")
+
+        def report(result):
+            if result["ok"]:
+                self.log(f"[{os.path.basename(result['input_path'])}] Saved to: {result['output_dir']}")
+            elif result.get("cancelled"):
+                self.log(f"⏹ Cancelled: {result['input_path']}")
+            else:
+                self.log(f"❌ Error processing {result['input_path']}: {result['error']}")
+            self.call_in_ui(self.advance_progress, result["input_path"])
+
+        self.start_progress([job["input_path"] for job in jobs])
+
         def run():
-            from logic.converter_core import process_obj_file
-            had_error = False
-            for file, java_field, model_field in self.entry_boxes:
-                try:
-                    model_name = model_field.get().strip()
-                    java_name = java_field.get().strip() if self.create_java.get() else None
-                    generate_txt = self.create_txt.get()
-                    hbm_enabled = self.enable_hbm.get()
-
-                    out_subdir = os.path.join(self.output_dir, os.path.splitext(os.path.basename(file))[0])
-                    os.makedirs(out_subdir, exist_ok=True)
-
-                    self.log(f"\nProcessing: {file}")
-                    process_obj_file(file, out_subdir, java_name, self.log,
-                                     generate_txt=generate_txt, output_name=model_name,
-                                     enable_hbm=hbm_enabled)
-                    self.log(f"Saved to: {out_subdir}")
-                except Exception as e:
-                    had_error = True
-                    self.log(f"❌ Error processing {file}: {str(e)}")
-
-            self.update_output_preview()
-            if not had_error:
+            from logic.batch import format_cache_stats, run_batch
+            results = run_batch(jobs, workers=workers, on_result=report, cancel_event=cancel_event, on_log=job_log)
+            if cache is not None:
+                self.log(format_cache_stats(results))
+
+            self.call_in_ui(self.refresh_tree_paths, [result["output_dir"] for result in results])
+            self.call_in_ui(self.finish_cancel_buttons)
+            if all(result["ok"] for result in results):
                 self.log("\n✅ All conversions complete.")
+            elif cancel_event.is_set() or all(result["ok"] or result.get("cancelled") for result in results):
+                self.log("\n⏹ Conversion cancelled.")
             else:
                 self.log("\n⚠️ Some conversions failed. Check logs above.")
 
         threading.Thread(target=run).start()
 
-if __name__ == '__main__':
+def main():
     if not check_dependencies():
         sys.exit(1)
+    check_blender()
     app = OBJFixerGUI()
-    app.mainloop()
\ No newline at end of file
+    app.mainloop()
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
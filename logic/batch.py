@@ -0,0 +1,178 @@
+import os
+import time
+import queue
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from logic.blender_cleaner import POLL_SECONDS, JobCancelled
+from logic.converter_core import process_obj_file
+from logic.instrumentation import Tracer, capture_profile, format_breakdown
+
+JOB_OPTIONS = ("java_class", "generate_txt", "output_name", "enable_hbm", "engine", "cache",
+               "timeout", "cancel_event", "write_index", "compact", "quantize")
+
+def default_workers():
+    return max(1, (os.cpu_count() or 1) - 1)
+
+# === Output Folders ===
+# Jobs write into <output root>/<input stem>. Inputs that share a stem (say
+# a/model.obj and b/model.obj) would write the same files at the same time in
+# the pool, so repeats get _2, _3, ... in input order. `taken` lists folders
+# already claimed by other jobs. Returns one folder per input, in order.
+def unique_output_dirs(input_paths, output_root, taken=()):
+    claimed = {os.path.normcase(os.path.abspath(path)) for path in taken}
+    folders = []
+    for path in input_paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        folder = os.path.join(output_root, stem)
+        suffix = 2
+        while os.path.normcase(os.path.abspath(folder)) in claimed:
+            folder = os.path.join(output_root, f"{stem}_{suffix}")
+            suffix += 1
+        claimed.add(os.path.normcase(os.path.abspath(folder)))
+        folders.append(folder)
+    return folders
+
+def failed_result(job, error, cancelled=False):
+    return {"id": job.get("id"), "input_path": job["input_path"], "output_dir": job["output_dir"],
+            "ok": False, "error": error, "cancelled": cancelled, "groups": [], "log": [],
+            "timings": [], "seconds": 0.0}
+
+# === Single Job (runs inside a pool process) ===
+# A job's "profile" entry, if set, is a path prefix for cProfile/tracemalloc output.
+# "timeout" bounds the Blender run in seconds; setting "cancel_event" stops the job.
+# on_log, if given, also receives every log line as it is written.
+def run_job(job, on_log=None):
+    messages = []
+
+    def logger(message):
+        messages.append(message)
+        if on_log:
+            on_log(message)
+
+    started = time.perf_counter()
+    tracer = Tracer(input=job["input_path"])
+    result = {"id": job.get("id"), "input_path": job["input_path"], "output_dir": job["output_dir"],
+              "ok": True, "error": None, "cancelled": False, "groups": [], "log": messages,
+              "timings": tracer.spans}
+    try:
+        os.makedirs(job["output_dir"], exist_ok=True)
+        options = {key: job[key] for key in JOB_OPTIONS if key in job}
+        args = (job["input_path"], job["output_dir"])
+        options.update(logger=logger, tracer=tracer)
+        if job.get("profile"):
+            result["groups"] = capture_profile(job["profile"], process_obj_file, *args, **options)
+            messages.append(f"Profile saved to: {job['profile']}.prof")
+        else:
+            result["groups"] = process_obj_file(*args, **options)
+    except Exception as e:
+        result["ok"] = False
+        result["error"] = str(e)
+        result["cancelled"] = isinstance(e, JobCancelled)
+    result["seconds"] = time.perf_counter() - started
+    if tracer.spans:
+        logger(format_breakdown(tracer.spans))
+    return result
+
+# Pool processes cannot call back into the parent, so their log lines travel
+# through a Manager queue tagged with the job's position in the batch.
+class QueueLogger:
+    def __init__(self, log_queue, index):
+        self.log_queue = log_queue
+        self.index = index
+
+    def __call__(self, message):
+        self.log_queue.put((self.index, message))
+
+# === Cache Statistics ===
+# Pool jobs each get a pickled copy of the cache, so hits and misses are
+# counted from the results' cache_lookup spans instead.
+def cache_stats(results):
+    lookups = [span["hit"] for result in results for span in result["timings"] if span["span"] == "cache_lookup"]
+    return {"hits": sum(lookups), "misses": len(lookups) - sum(lookups)}
+
+def format_cache_stats(results):
+    stats = cache_stats(results)
+    return f"Cache: {stats['hits']} hit(s), {stats['misses']} miss(es)."
+
+# === Batch Scheduler ===
+# cancel_event cancels the whole batch: queued jobs are dropped and running
+# ones are stopped. A job's own "cancel_event" cancels just that job; either
+# one being set stops it. on_log(job, message) receives log lines while jobs
+# run; on_result(result) gets each finished job.
+class EitherEvent:
+    # The pipeline only ever calls is_set() on its cancel event.
+    def __init__(self, *events):
+        self.events = [event for event in events if event is not None]
+
+    def is_set(self):
+        return any(event.is_set() for event in self.events)
+
+def run_batch(jobs, workers=None, on_result=None, cancel_event=None, on_log=None):
+    workers = workers or default_workers()
+    results = []
+
+    def collect(result):
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    def cancelled(job):
+        return any(event is not None and event.is_set() for event in (cancel_event, job.get("cancel_event")))
+
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            if cancelled(job):
+                collect(failed_result(job, "Cancelled.", cancelled=True))
+            else:
+                events = EitherEvent(cancel_event, job.get("cancel_event"))
+                job_log = (lambda message, job=job: on_log(job, message)) if on_log else None
+                collect(run_job(dict(job, cancel_event=events), job_log))
+        return results
+
+    manager = log_queue = None
+    shared_events = {}
+    cancellable = cancel_event is not None or any(job.get("cancel_event") is not None for job in jobs)
+    if cancellable or on_log:
+        manager = multiprocessing.Manager()
+    if cancellable:
+        # Pool processes need picklable events: each job gets its own Manager
+        # event, keyed by its position in the batch, which mirrors the caller's.
+        shared_events = {index: manager.Event() for index in range(len(jobs))}
+    if on_log:
+        log_queue = manager.Queue()
+
+    def forward_logs():
+        while log_queue is not None:
+            try:
+                index, message = log_queue.get_nowait()
+            except queue.Empty:
+                return
+            on_log(jobs[index], message)
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = {pool.submit(run_job, dict(job, cancel_event=shared_events.get(index)),
+                                   QueueLogger(log_queue, index) if log_queue is not None else None): index
+                       for index, job in enumerate(jobs)}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+                # A finished job's lines are all queued by now, so they arrive before its result.
+                forward_logs()
+                for future in list(pending):
+                    index = futures[future]
+                    if shared_events and cancelled(jobs[index]) and not shared_events[index].is_set():
+                        shared_events[index].set()
+                        if future.cancel():
+                            pending.discard(future)
+                            collect(failed_result(jobs[index], "Cancelled.", cancelled=True))
+                for future in done:
+                    try:
+                        collect(future.result())
+                    except Exception as e:
+                        # The pool process itself died; report the job rather than aborting the batch.
+                        collect(failed_result(jobs[futures[future]], str(e)))
+    finally:
+        if manager is not None:
+            manager.shutdown()
+    return results
@@ -1,18 +1,32 @@
 import os
 import sys
+import json
+import time
+import threading
 import subprocess
-import tempfile
 import webbrowser
-import tkinter as tk
-from tkinter import messagebox
+from collections import deque
 
 TEMP_DIR = os.path.join(os.path.dirname(__file__), "..", "temp")
-BLENDER_PATH = os.path.join(os.path.dirname(__file__), "..", "tools", "blender-3.6.22-windows-x64", "blender.exe")
+BLENDER_PATH = os.environ.get("OBJ_FIXER_BLENDER") or os.path.join(
+    os.path.dirname(__file__), "..", "tools", "blender-3.6.22-windows-x64", "blender.exe")
+CLEANER_VERSION = "2"
+BLENDER_SCRIPT = os.path.join(os.path.dirname(__file__), "blender_script.py")
+RESULT_PREFIX = "@@OBJFIXER "
+POLL_SECONDS = 0.1
+STDERR_TAIL_LINES = 40
 
-if not os.path.exists(TEMP_DIR):
-    os.makedirs(TEMP_DIR)
+class BlenderTimeout(RuntimeError):
+    pass
+
+class JobCancelled(RuntimeError):
+    pass
 
 def prompt_blender_missing():
+    # Imported here so headless callers never load Tk.
+    import tkinter as tk
+    from tkinter import messagebox
+
     root = tk.Tk()
     root.withdraw()
     if messagebox.askyesno("Missing Blender", "Blender was not found in the expected location.\nWould you like to download Blender 3.6.22 now?"):
@@ -27,98 +41,116 @@ def prompt_blender_missing():
         messagebox.showwarning("Blender Required", "This tool requires Blender 3.6.22 to continue.")
     sys.exit(1)
 
-def run_blender_cleaner(input_obj, enable_hbm=False):
+# A .py file can stand in for blender.exe (see logic/blender_stub.py)
+def blender_command(blender_path=None):
+    path = blender_path or BLENDER_PATH
+    if path.endswith(".py"):
+        return [sys.executable, path]
+    return [path]
+
+def children_cpu_seconds():
+    times = os.times()
+    return times.children_user + times.children_system
+
+# Fills stats with the Blender run's wall and CPU time, split into startup and
+# cleaning using the timings blender_script.py reports.
+def record_blender_stats(stats, reply, wall_seconds, cpu_seconds):
+    if stats is None:
+        return
+    work = reply.get("seconds", 0.0)
+    stats.update({
+        "subprocess_wall_seconds": round(wall_seconds, 6),
+        "subprocess_cpu_seconds": round(cpu_seconds, 6),
+        "work_seconds": round(work, 6),
+        "startup_seconds": round(max(wall_seconds - work, 0.0), 6),
+        "objects": reply.get("objects"),
+        "vertices": reply.get("vertices"),
+    })
+
+# === Managed Blender Process ===
+def start_reader(stream, handle, on_close=None):
+    def read():
+        for line in stream:
+            handle(line.rstrip("\n"))
+        if on_close:
+            on_close()
+    thread = threading.Thread(target=read, daemon=True)
+    thread.start()
+    return thread
+
+def protocol_handler(handle_reply, on_progress=None):
+    # Blender prints its own chatter to stdout; only prefixed lines are ours.
+    def handle(line):
+        if not line.startswith(RESULT_PREFIX):
+            return
+        message = json.loads(line[len(RESULT_PREFIX):])
+        if "event" not in message:
+            handle_reply(message)
+        elif on_progress:
+            on_progress(message)
+    return handle
+
+def failure_details(tail):
+    return ("\nBlender stderr (last lines):\n" + "\n".join(tail)) if tail else ""
+
+def wait_for_process(process, started, timeout=None, cancel_event=None):
+    while True:
+        try:
+            process.wait(timeout=POLL_SECONDS)
+            return "exited"
+        except subprocess.TimeoutExpired:
+            pass
+        if cancel_event is not None and cancel_event.is_set():
+            return "cancelled"
+        if timeout and time.perf_counter() - started > timeout:
+            return "timeout"
+
+def run_blender_cleaner(input_obj, enable_hbm=False, temp_dir=TEMP_DIR, stats=None,
+                        timeout=None, cancel_event=None, on_progress=None):
     if not os.path.exists(BLENDER_PATH):
-        prompt_blender_missing()
-
-    blender_script = f"""
-import bpy
-import sys
-import addon_utils
-import math
-from mathutils import Vector
-
-addon_utils.enable("io_scene_obj")
-
-argv = sys.argv
-argv = argv[argv.index("--") + 1:]
-input_path = argv[0]
-output_path = argv[1]
-hbm_mode = argv[2].lower() == "true" if len(argv) > 2 else False
-
-bpy.ops.wm.read_factory_settings(use_empty=True)
-bpy.ops.import_scene.obj(filepath=input_path)
-
-mesh_objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
-if not mesh_objects:
-    print("No mesh objects found.")
-    sys.exit(1)
-
-if hbm_mode:
-    print("Applying HBM scaling and orientation to each object...")
-
-    for obj in mesh_objects:
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-
-        bpy.ops.transform.rotate(value=math.radians(180), orient_axis='X')
-        bpy.ops.transform.rotate(value=math.radians(180), orient_axis='Z')
-        bpy.ops.transform.resize(value=(16.0, 16.0, 16.0))
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-
-    all_verts = [obj.matrix_world @ v.co for obj in mesh_objects for v in obj.data.vertices]
-    min_x = min(v.x for v in all_verts)
-    max_x = max(v.x for v in all_verts)
-    min_y = min(v.y for v in all_verts)
-    max_y = max(v.y for v in all_verts)
-    min_z = min(v.z for v in all_verts)
-
-    offset_x = -(min_x + max_x) / 2
-    offset_y = -(min_y + max_y) / 2 + 0.4
-    offset_z = -min_z - 9.1
-
-    for obj in mesh_objects:
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-
-        bpy.ops.transform.translate(value=(offset_x, offset_y, offset_z))
-        bpy.ops.object.transform_apply(location=True, rotation=False, scale=False)
-
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.normals_make_consistent(inside=False)
-        bpy.ops.mesh.quads_convert_to_tris()
-        bpy.ops.mesh.remove_doubles(threshold=0.0001)
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-    # Ensure clean selection for export
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in mesh_objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = mesh_objects[0]
-
-bpy.ops.export_scene.obj(filepath=output_path, use_selection=True, use_materials=False)
-"""
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".py", dir=TEMP_DIR, mode='w', encoding='utf-8') as temp_script:
-        temp_script.write(blender_script)
-        temp_script_path = temp_script.name
-
-    output_obj = os.path.join(TEMP_DIR, os.path.basename(input_obj).replace(".obj", "_cleaned.obj"))
-
+        raise FileNotFoundError("Blender not found at: " + BLENDER_PATH)
+
+    os.makedirs(temp_dir, exist_ok=True)
+    output_obj = os.path.join(temp_dir, os.path.basename(input_obj).replace(".obj", "_cleaned.obj"))
+
+    started, cpu_started = time.perf_counter(), children_cpu_seconds()
+    process = subprocess.Popen(blender_command() + [
+        "--background", "--python", BLENDER_SCRIPT, "--",
+        os.path.abspath(input_obj),
+        os.path.abspath(output_obj),
+        str(enable_hbm)
+    ], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, encoding='utf-8', errors='replace')
+
+    replies = []
+    stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+    readers = [start_reader(process.stdout, protocol_handler(replies.append, on_progress)),
+               start_reader(process.stderr, stderr_tail.append)]
     try:
-        subprocess.run([
-            BLENDER_PATH, "--background", "--python", temp_script_path, "--",
-            os.path.abspath(input_obj),
-            os.path.abspath(output_obj),
-            str(enable_hbm)
-        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        status = wait_for_process(process, started, timeout, cancel_event)
     finally:
-        os.remove(temp_script_path)
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        for reader in readers:
+            reader.join()
+
+    reply = replies[-1] if replies else {}
+    if status == "cancelled":
+        raise JobCancelled("Cancelled.")
+    if status == "timeout":
+        raise BlenderTimeout(f"Blender timed out after {timeout:g}s." + failure_details(stderr_tail))
+    if process.returncode != 0:
+        reason = f": {reply['error']}" if reply.get("error") else ""
+        raise RuntimeError(f"Blender exited with code {process.returncode}{reason}" + failure_details(stderr_tail))
+    # os.times() reports no child times on Windows; fall back to the script's
+    # own CPU time there, which leaves out Blender's startup.
+    cpu_seconds = children_cpu_seconds() - cpu_started
+    if sys.platform == "win32" or cpu_seconds <= 0:
+        cpu_seconds = reply.get("cpu_seconds", 0.0)
+    record_blender_stats(stats, reply, time.perf_counter() - started, cpu_seconds)
 
     if not os.path.exists(output_obj):
-        raise RuntimeError("Blender did not produce the cleaned .obj file as expected.")
+        raise RuntimeError("Blender did not produce the cleaned .obj file as expected." + failure_details(stderr_tail))
 
     return output_obj
@@ -0,0 +1,154 @@
+# Runs inside Blender: blender --background --python blender_script.py -- <args>
+#   one-shot: -- <input.obj> <output.obj> [hbm]
+#   worker:   -- --worker   (jobs as JSON lines on stdin, results on stdout)
+import bpy
+import sys
+import json
+import addon_utils
+import time
+import numpy as np
+
+RESULT_PREFIX = "@@OBJFIXER "
+
+# Rotating 180° about X then Z and scaling by 16, as one basis change.
+HBM_BASIS = np.diag([-16.0, 16.0, -16.0])
+HBM_OFFSET_Y = 0.4
+HBM_OFFSET_Z = -9.1
+WELD_THRESHOLD = 0.0001
+
+def reset_scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon_utils.enable("io_scene_obj")
+
+def select_only(objects):
+    bpy.ops.object.select_all(action='DESELECT')
+    for obj in objects:
+        obj.select_set(True)
+    bpy.context.view_layer.objects.active = objects[0]
+
+# === HBM Transform (data level) ===
+# The math only needs plain sequences and mesh.vertices.foreach_get, so
+# tests/test_blender_script.py drives it with the fakes in tests/fake_bpy.py.
+def hbm_base_matrix(matrix_world):
+    # Rotation and scale pivot on the object's own origin, like the transform
+    # operators in object mode; the result is baked straight into the mesh.
+    world = np.asarray(matrix_world, dtype=np.float64)
+    base = np.identity(4)
+    base[:3, :3] = HBM_BASIS @ world[:3, :3]
+    base[:3, 3] = world[:3, 3]
+    return base
+
+def vertex_coordinates(mesh):
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3).astype(np.float64)
+
+def hbm_offset(minimum, maximum):
+    return np.array([-(minimum[0] + maximum[0]) / 2,
+                     -(minimum[1] + maximum[1]) / 2 + HBM_OFFSET_Y,
+                     -minimum[2] + HBM_OFFSET_Z])
+
+def hbm_matrices(mesh_objects):
+    # One combined matrix per object: basis change, then the shared offset that
+    # centres the model on X/Y and drops it to the HBM floor.
+    matrices = [hbm_base_matrix(obj.matrix_world) for obj in mesh_objects]
+    lows, highs = [], []
+    for obj, matrix in zip(mesh_objects, matrices):
+        co = vertex_coordinates(obj.data)
+        if len(co):
+            world = co @ matrix[:3, :3].T + matrix[:3, 3]
+            lows.append(world.min(axis=0))
+            highs.append(world.max(axis=0))
+    if lows:
+        offset = hbm_offset(np.min(lows, axis=0), np.max(highs, axis=0))
+        for matrix in matrices:
+            matrix[:3, 3] += offset
+    return matrices
+
+def apply_hbm(mesh_objects):
+    identity = np.identity(4).tolist()
+    for obj, matrix in zip(mesh_objects, hbm_matrices(mesh_objects)):
+        obj.data.transform(matrix.tolist())
+        obj.matrix_world = identity
+        obj.data.update()
+
+def cleanup_meshes(mesh_objects):
+    # A single multi-object edit session; each object keeps its own mesh.
+    select_only(mesh_objects)
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    bpy.ops.mesh.normals_make_consistent(inside=False)
+    bpy.ops.mesh.quads_convert_to_tris()
+    bpy.ops.mesh.remove_doubles(threshold=WELD_THRESHOLD)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+def clean(input_path, output_path, hbm_mode):
+    reset_scene()
+    bpy.ops.import_scene.obj(filepath=input_path)
+
+    mesh_objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+    if not mesh_objects:
+        raise RuntimeError("No mesh objects found.")
+    progress("import_done", objects=len(mesh_objects))
+
+    if hbm_mode:
+        print("Applying HBM scaling and orientation to each object...")
+        apply_hbm(mesh_objects)
+        progress("transformed", objects=len(mesh_objects))
+        cleanup_meshes(mesh_objects)
+        progress("cleaned")
+
+        # Ensure clean selection for export
+        select_only(mesh_objects)
+
+    bpy.ops.export_scene.obj(filepath=output_path, use_selection=True, use_materials=False)
+    progress("export_done")
+    return {"objects": len(mesh_objects), "vertices": sum(len(obj.data.vertices) for obj in mesh_objects)}
+
+# Time spent cleaning, as opposed to Blender starting up, for instrumentation.
+def timed_clean(input_path, output_path, hbm_mode):
+    started, cpu_started = time.perf_counter(), time.process_time()
+    result = clean(input_path, output_path, hbm_mode)
+    result["seconds"] = time.perf_counter() - started
+    result["cpu_seconds"] = time.process_time() - cpu_started
+    return result
+
+def reply(payload):
+    sys.stdout.write(RESULT_PREFIX + json.dumps(payload) + "\n")
+    sys.stdout.flush()
+
+# Progress events share the reply channel; the caller tells them apart by "event".
+def progress(event, **fields):
+    reply(dict(fields, event=event))
+
+def serve():
+    reply({"ready": True})
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        try:
+            result = timed_clean(job["input"], job["output"], job.get("hbm", False))
+            reply(dict(result, id=job["id"], ok=True))
+        except Exception as e:
+            reply({"id": job["id"], "ok": False, "error": str(e)})
+
+def main():
+    argv = sys.argv
+    argv = argv[argv.index("--") + 1:]
+    if argv and argv[0] == "--worker":
+        serve()
+        return
+
+    input_path = argv[0]
+    output_path = argv[1]
+    hbm_mode = argv[2].lower() == "true" if len(argv) > 2 else False
+    try:
+        reply(dict(timed_clean(input_path, output_path, hbm_mode), ok=True))
+    except Exception as e:
+        reply({"ok": False, "error": str(e)})
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
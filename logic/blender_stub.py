@@ -0,0 +1,62 @@
+# Stand-in for blender.exe that speaks the same command line and worker
+# protocol as logic/blender_script.py, copying input to output unchanged.
+# Point OBJ_FIXER_BLENDER (or blender_path=...) at this file to use it.
+# In worker mode an input ending in crash.obj kills the process, so restart
+# handling can be exercised. In either mode an input ending in hang.obj never
+# finishes (for timeouts and cancellation) and one ending in fail.obj writes to
+# stderr and fails.
+import sys
+import json
+import time
+import shutil
+
+RESULT_PREFIX = "@@OBJFIXER "
+
+def reply(payload):
+    sys.stdout.write(RESULT_PREFIX + json.dumps(payload) + "\n")
+    sys.stdout.flush()
+
+def copy(input_path, output_path):
+    started, cpu_started = time.perf_counter(), time.process_time()
+    reply({"event": "import_done", "objects": 0})
+    if input_path.endswith("hang.obj"):
+        while True:
+            time.sleep(1)
+    if input_path.endswith("fail.obj"):
+        print("Error: stub failure for " + input_path, file=sys.stderr)
+        raise RuntimeError("Stub failure.")
+    shutil.copyfile(input_path, output_path)
+    reply({"event": "export_done"})
+    return {"objects": 0, "vertices": 0, "seconds": time.perf_counter() - started,
+            "cpu_seconds": time.process_time() - cpu_started}
+
+def serve():
+    reply({"ready": True})
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        if job["input"].endswith("crash.obj"):
+            sys.exit(3)
+        try:
+            reply(dict(copy(job["input"], job["output"]), id=job["id"], ok=True))
+        except Exception as e:
+            reply({"id": job["id"], "ok": False, "error": str(e)})
+
+def main():
+    argv = sys.argv
+    if "--version" in argv:
+        print("Blender 0.0.0 (stub)")
+        return
+    argv = argv[argv.index("--") + 1:]
+    if argv and argv[0] == "--worker":
+        serve()
+        return
+    try:
+        reply(dict(copy(argv[0], argv[1]), ok=True))
+    except Exception as e:
+        reply({"ok": False, "error": str(e)})
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import queue
+import atexit
+import itertools
+import threading
+import subprocess
+from collections import deque
+from logic.blender_cleaner import (BLENDER_PATH, BLENDER_SCRIPT, POLL_SECONDS, STDERR_TAIL_LINES, TEMP_DIR,
+                                   BlenderTimeout, JobCancelled, blender_command, failure_details,
+                                   protocol_handler, record_blender_stats, start_reader)
+
+STARTUP_TIMEOUT_SECONDS = 120
+
+# === Persistent Blender Worker ===
+class BlenderWorker:
+    def __init__(self, blender_path=None, retries=1):
+        self.blender_path = blender_path or BLENDER_PATH
+        self.retries = retries
+        self.restarts = 0
+        self.process = None
+        self.messages = None
+        self.progress = None
+        self.stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start(self):
+        if not os.path.exists(self.blender_path):
+            raise FileNotFoundError("Blender not found at: " + self.blender_path)
+        self.process = subprocess.Popen(
+            blender_command(self.blender_path) + ["--background", "--python", BLENDER_SCRIPT, "--", "--worker"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding='utf-8', errors='replace', bufsize=1)
+
+        # Reader threads keep the pipes drained, so replies can be awaited with
+        # a deadline; None on the queue means stdout closed.
+        messages = self.messages = queue.Queue()
+        self.stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        start_reader(self.process.stdout, protocol_handler(messages.put, self._on_progress),
+                     on_close=lambda: messages.put(None))
+        start_reader(self.process.stderr, self.stderr_tail.append)
+        if not self._read_reply(timeout=STARTUP_TIMEOUT_SECONDS).get("ready"):
+            raise RuntimeError("Blender worker did not report ready.")
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def close(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+        self.process = None
+
+    def kill(self):
+        if self.process is None:
+            return
+        self.process.kill()
+        self.process.wait()
+        self.process = None
+
+    def _on_progress(self, event):
+        if self.progress:
+            self.progress(event)
+
+    def _read_reply(self, timeout=None, cancel_event=None):
+        started = time.perf_counter()
+        while True:
+            try:
+                message = self.messages.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                if cancel_event is not None and cancel_event.is_set():
+                    # Blender cannot be interrupted mid-job; the next job restarts it.
+                    self.kill()
+                    raise JobCancelled("Cancelled.")
+                if timeout and time.perf_counter() - started > timeout:
+                    tail = list(self.stderr_tail)
+                    self.kill()
+                    raise BlenderTimeout(f"Blender worker timed out after {timeout:g}s." + failure_details(tail))
+                continue
+            if message is None:
+                raise BrokenPipeError("Blender worker exited unexpectedly.")
+            return message
+
+    def _send(self, job, timeout=None, cancel_event=None):
+        if not self.alive():
+            self.start()
+        self.process.stdin.write(json.dumps(job) + "\n")
+        self.process.stdin.flush()
+        return self._read_reply(timeout, cancel_event)
+
+    def convert(self, input_obj, output_obj, enable_hbm=False, timeout=None, cancel_event=None, on_progress=None):
+        job = {
+            "id": next(self._ids),
+            "input": os.path.abspath(input_obj),
+            "output": os.path.abspath(output_obj),
+            "hbm": bool(enable_hbm),
+        }
+        if not os.path.exists(self.blender_path):
+            raise FileNotFoundError("Blender not found at: " + self.blender_path)
+
+        with self._lock:
+            self.progress = on_progress
+            # Diagnostics belong to this job only; the reader thread keeps
+            # appending to the same deque.
+            self.stderr_tail.clear()
+            attempt = 0
+            try:
+                while True:
+                    try:
+                        result = self._send(job, timeout, cancel_event)
+                        break
+                    except (BrokenPipeError, OSError):
+                        # The next _send starts a fresh process.
+                        tail = list(self.stderr_tail)
+                        self.close()
+                        self.restarts += 1
+                        attempt += 1
+                        if attempt > self.retries:
+                            raise RuntimeError("Blender worker crashed while converting: " + input_obj
+                                               + failure_details(tail))
+            finally:
+                self.progress = None
+
+        if result.get("id") != job["id"]:
+            raise RuntimeError("Blender worker replied out of order.")
+        if not result.get("ok"):
+            # stderr is read on its own thread; give it a moment to catch up with the reply.
+            time.sleep(POLL_SECONDS)
+            raise RuntimeError("Blender worker failed: " + result.get("error", "unknown error")
+                               + failure_details(list(self.stderr_tail)))
+        return result
+
+_shared_worker = None
+
+def get_worker():
+    global _shared_worker
+    if _shared_worker is None:
+        _shared_worker = BlenderWorker()
+        atexit.register(_shared_worker.close)
+    return _shared_worker
+
+def run_worker_cleaner(input_obj, enable_hbm=False, temp_dir=TEMP_DIR, worker=None, stats=None,
+                       timeout=None, cancel_event=None, on_progress=None):
+    worker = worker or get_worker()
+    os.makedirs(temp_dir, exist_ok=True)
+    output_obj = os.path.join(temp_dir, os.path.basename(input_obj).replace(".obj", "_cleaned.obj"))
+    started = time.perf_counter()
+    result = worker.convert(input_obj, output_obj, enable_hbm=enable_hbm, timeout=timeout,
+                            cancel_event=cancel_event, on_progress=on_progress)
+    # The worker outlives the job, so its CPU time comes from its own report.
+    record_blender_stats(stats, result, time.perf_counter() - started, result.get("cpu_seconds", 0.0))
+
+    if not os.path.exists(output_obj):
+        raise RuntimeError("Blender did not produce the cleaned .obj file as expected.")
+
+    return output_obj
@@ -0,0 +1,156 @@
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from logic.batch import cache_stats, default_workers, run_batch, unique_output_dirs
+from logic.converter_core import ENGINES
+from logic.instrumentation import JsonLinesSink, span_totals
+
+TRUE_VALUES = ("1", "true", "yes", "y", "on")
+
+# === Manifest Loading ===
+def _flag(value, default=False):
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_VALUES
+
+def read_manifest(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith(".csv"):
+            return [dict(row) for row in csv.DictReader(f)]
+        data = json.load(f)
+    return data["jobs"] if isinstance(data, dict) else data
+
+def build_jobs(entries, manifest_dir, output_root, args, cache=None):
+    # Explicit output folders are kept as given; the rest get unique folders
+    # so parallel jobs never write the same files.
+    inputs = [os.path.join(manifest_dir, entry["input"]) for entry in entries]
+    explicit = {index: os.path.join(manifest_dir, entry["output_dir"])
+                for index, entry in enumerate(entries) if entry.get("output_dir")}
+    implicit = [index for index in range(len(entries)) if index not in explicit]
+    defaults = dict(zip(implicit, unique_output_dirs([inputs[index] for index in implicit],
+                                                     output_root, taken=explicit.values())))
+
+    jobs = []
+    outputs = set()
+    for index, entry in enumerate(entries):
+        input_path = inputs[index]
+        stem = os.path.splitext(os.path.basename(input_path))[0]
+        output_dir = explicit.get(index) or defaults[index]
+        output = os.path.normcase(os.path.abspath(os.path.join(output_dir, entry.get("output_name") or stem)))
+        if output in outputs:
+            raise ValueError(f"Entry {index} writes the same output as an earlier entry: {output}")
+        outputs.add(output)
+        jobs.append({
+            "id": index,
+            "input_path": input_path,
+            "output_dir": output_dir,
+            "output_name": entry.get("output_name") or stem,
+            "java_class": entry.get("java_class") or None,
+            "generate_txt": _flag(entry.get("generate_txt"), args.txt),
+            "enable_hbm": _flag(entry.get("enable_hbm", entry.get("hbm")), args.hbm),
+            "write_index": _flag(entry.get("write_index"), args.index),
+            "compact": _flag(entry.get("compact"), args.compact),
+            "quantize": int(entry["quantize"]) if entry.get("quantize") not in (None, "") else args.quantize,
+            "engine": entry.get("engine") or args.engine,
+            "cache": cache,
+            "timeout": float(entry["timeout"]) if entry.get("timeout") else args.timeout,
+            "profile": os.path.join(args.profile, f"{index}_{stem}") if args.profile else None,
+        })
+    return jobs
+
+# === Summary ===
+def job_summary(result, job):
+    return {
+        "input": result["input_path"],
+        "output_dir": result["output_dir"],
+        "output_name": job["output_name"],
+        "status": "ok" if result["ok"] else "cancelled" if result.get("cancelled") else "error",
+        "error": result["error"],
+        "groups": len(result["groups"]),
+        "seconds": round(result["seconds"], 4),
+        "timings": span_totals(result["timings"]),
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m logic.cli",
+        description="Convert Blockbench OBJ exports listed in a JSON or CSV manifest, without the GUI.")
+    parser.add_argument("manifest", help="JSON list (or {\"jobs\": [...]}) or CSV with an 'input' column; "
+                                         "optional output_name, java_class, enable_hbm, generate_txt, "
+                                         "write_index, compact, quantize, engine, timeout and output_dir per entry")
+    parser.add_argument("-o", "--output-dir", default="output",
+                        help="root for per-model output folders (default: ./output)")
+    parser.add_argument("-j", "--jobs", type=int, default=default_workers(), help="parallel conversions")
+    parser.add_argument("--engine", choices=ENGINES, default="blender", help="default cleaning engine")
+    parser.add_argument("--hbm", action="store_true", help="enable HBM mode unless an entry says otherwise")
+    parser.add_argument("--txt", action="store_true", help="write .txt group lists unless an entry says otherwise")
+    parser.add_argument("--index", action="store_true",
+                        help="write a <name>.groups.json group index unless an entry says otherwise")
+    parser.add_argument("--compact", action="store_true",
+                        help="merge duplicate and drop unused v/vt/vn records unless an entry says otherwise")
+    parser.add_argument("--quantize", type=int, metavar="DECIMALS",
+                        help="round records to this many decimals before compacting")
+    parser.add_argument("--cache", action="store_true", help="use the on-disk conversion cache")
+    parser.add_argument("--timeout", type=float, help="seconds a Blender run may take before it is killed")
+    parser.add_argument("--summary", help="write the JSON summary here instead of stdout")
+    parser.add_argument("--trace", help="append per-stage timing spans to this JSON lines file")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="profile every job with cProfile and tracemalloc, writing reports to DIR")
+    parser.add_argument("-v", "--verbose", action="store_true", help="echo per-file logs to stderr")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    manifest_dir = os.path.dirname(os.path.abspath(args.manifest))
+
+    cache = None
+    if args.cache:
+        from logic.conversion_cache import ConversionCache
+        cache = ConversionCache()
+
+    try:
+        jobs = build_jobs(read_manifest(args.manifest), manifest_dir, os.path.abspath(args.output_dir), args, cache)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    trace = JsonLinesSink(args.trace) if args.trace else None
+
+    def report(result):
+        if trace:
+            for span in result["timings"]:
+                trace.emit(span)
+        status = "ok" if result["ok"] else "error: " + str(result["error"])
+        print(f"[{status}] {result['input_path']} ({result['seconds']:.2f}s)", file=sys.stderr)
+
+    def echo(job, message):
+        print(f"    {os.path.basename(job['input_path'])}: {message}", file=sys.stderr)
+
+    started = time.perf_counter()
+    results = run_batch(jobs, workers=max(1, args.jobs), on_result=report, on_log=echo if args.verbose else None)
+    results.sort(key=lambda result: result["id"])
+
+    summary = {
+        "ok": all(result["ok"] for result in results),
+        "total": len(results),
+        "failed": sum(not result["ok"] for result in results),
+        "workers": max(1, args.jobs),
+        "seconds": round(time.perf_counter() - started, 4),
+        "cache": cache_stats(results) if cache else None,
+        "jobs": [job_summary(result, jobs[result["id"]]) for result in results],
+    }
+    text = json.dumps(summary, indent=2)
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0 if summary["ok"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
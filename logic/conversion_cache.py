@@ -0,0 +1,124 @@
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import subprocess
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "cache")
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+HASH_CHUNK = 1 << 20
+VERSION_TIMEOUT_SECONDS = 60
+
+# === Version Helpers ===
+# Asks the binary itself, so pointing OBJ_FIXER_BLENDER at another build
+# invalidates cached results. Memoized per path and binary mtime, since
+# starting Blender takes a while.
+_blender_versions = {}
+
+def blender_version(blender_path):
+    from logic.blender_cleaner import blender_command
+    try:
+        stat = os.stat(blender_path)
+    except OSError:
+        return "unknown"
+    memo_key = (os.path.realpath(blender_path), stat.st_mtime_ns, stat.st_size)
+    if memo_key not in _blender_versions:
+        try:
+            output = subprocess.run(blender_command(blender_path) + ["--version"], capture_output=True,
+                                    text=True, errors='replace', timeout=VERSION_TIMEOUT_SECONDS).stdout
+        except (OSError, subprocess.TimeoutExpired):
+            output = ""
+        match = re.search(r"Blender\s+(\S+)", output)
+        _blender_versions[memo_key] = match.group(1) if match else "unknown"
+    return _blender_versions[memo_key]
+
+def cache_key(input_path, **options):
+    digest = hashlib.sha256()
+    with open(input_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    digest.update(json.dumps(options, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+# === Content-Addressed Conversion Cache ===
+class ConversionCache:
+    def __init__(self, root=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def _entry_dir(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def lookup(self, key):
+        entry = self._entry_dir(key)
+        meta_path = os.path.join(entry, "meta.json")
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(meta_path)  # meta.json mtime doubles as the LRU access time
+        meta["files"] = {name: os.path.join(entry, name) for name in meta["files"]}
+        return meta
+
+    def restore(self, key, dest_dir):
+        meta = self.lookup(key)
+        if meta is None:
+            return None
+        restored = {}
+        for name, path in meta["files"].items():
+            restored[name] = os.path.join(dest_dir, name)
+            shutil.copyfile(path, restored[name])
+        meta["files"] = restored
+        return meta
+
+    def store(self, key, files, groups=()):
+        os.makedirs(self.root, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix="store_", dir=self.root)
+        try:
+            size = 0
+            for name, path in files.items():
+                shutil.copyfile(path, os.path.join(staging, name))
+                size += os.path.getsize(path)
+            with open(os.path.join(staging, "meta.json"), 'w', encoding='utf-8') as f:
+                json.dump({"files": sorted(files), "groups": list(groups), "size": size,
+                           "created": time.time()}, f)
+
+            entry = self._entry_dir(key)
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                # Another job stored the same key first; its entry is equivalent.
+                shutil.rmtree(staging, ignore_errors=True)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total = 0
+        for shard in os.listdir(self.root):
+            shard_dir = os.path.join(self.root, shard)
+            if not os.path.isdir(shard_dir) or shard.startswith("store_"):
+                continue
+            for key in os.listdir(shard_dir):
+                meta_path = os.path.join(shard_dir, key, "meta.json")
+                try:
+                    with open(meta_path, 'r', encoding='utf-8') as f:
+                        size = json.load(f)["size"]
+                    entries.append((os.path.getmtime(meta_path), size, os.path.join(shard_dir, key)))
+                except (OSError, ValueError, KeyError):
+                    continue
+                total += size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+        return total
@@ -1,15 +1,31 @@
 import os
 import shutil
+import tempfile
 import re
-from logic.blender_cleaner import run_blender_cleaner
+from logic import blender_cleaner
+from logic.blender_cleaner import JobCancelled, run_blender_cleaner
+from logic.blender_worker import run_worker_cleaner
+from logic.conversion_cache import blender_version, cache_key
+from logic.group_index import INDEX_SUFFIX, GroupIndexBuilder, write_group_index
+from logic.instrumentation import Tracer, file_size
+from logic.mesh import Mesh
+from logic.mesh_ops import compact_records
+from logic.native_engine import ENGINE_VERSION, clean_mesh
 
 TEMP_DIR = os.path.join(os.path.dirname(__file__), "..", "temp")
+ENGINES = ("blender", "worker", "native")
 
 # === Normalize Group Name ===
 def normalize_group_name(name):
     return re.sub(r'\.(\d+)', r'_\1', name)
 
 # === Deduplicate and Normalize OBJ Groups ===
+def rename_group(raw_name, group_counts):
+    norm_name = normalize_group_name(raw_name)
+    count = group_counts.get(norm_name, 0)
+    group_counts[norm_name] = count + 1
+    return f"{norm_name}_{count}" if count > 0 else norm_name
+
 def deduplicate_obj(obj_path):
     group_counts = {}
     new_lines = []
@@ -18,11 +34,7 @@ def deduplicate_obj(obj_path):
         for line in f:
             if line.startswith("o "):
                 raw_name = line.strip().split(" ", 1)[1]
-                norm_name = normalize_group_name(raw_name)
-                count = group_counts.get(norm_name, 0)
-                new_group = f"{norm_name}_{count}" if count > 0 else norm_name
-                group_counts[norm_name] = count + 1
-                new_lines.append(f"o {new_group}\n")
+                new_lines.append(f"o {rename_group(raw_name, group_counts)}\n")
             else:
                 new_lines.append(line)
 
@@ -31,6 +43,13 @@ def deduplicate_obj(obj_path):
 
     return sorted(group_counts.keys())
 
+# === Deduplicate and Normalize Mesh IR Groups ===
+def deduplicate_groups(mesh):
+    group_counts = {}
+    for group in mesh.groups:
+        group.name = rename_group(group.name, group_counts)
+    return sorted(group_counts.keys())
+
 # === Java Group Class Generator ===
 def write_java_class(class_name, group_names, output_dir):
     os.makedirs(output_dir, exist_ok=True)
@@ -64,48 +83,278 @@ def update_mtllib_reference(obj_path, new_mtl_filename):
     with open(obj_path, 'w', encoding='utf-8') as f:
         f.writelines(new_lines)
 
+# === Single-Pass Post-Processor ===
+# Renames groups and rewrites mtllib while streaming the cleaned OBJ straight
+# to its final path, so large exports are read once and never held in memory.
+# Works on bytes so it can also track each group's byte range for the index.
+WRITE_BUFFER_LINES = 8192
+WRITE_BUFFER_BYTES = 1 << 20
+
+# If given, `renamed` is filled with each final group name's base name.
+def postprocess_obj(src_path, dest_path, mtl_filename=None, index_path=None, renamed=None):
+    group_counts = {}
+    pending = []
+    index = GroupIndexBuilder() if index_path else None
+    offset = 0
+
+    with open(src_path, 'rb') as src, open(dest_path, 'wb', buffering=WRITE_BUFFER_BYTES) as dest:
+        for line in src:
+            if line.startswith(b"o "):
+                raw_name = line.strip().split(b" ", 1)[1].decode('utf-8')
+                name = rename_group(raw_name, group_counts)
+                if renamed is not None:
+                    renamed[name] = normalize_group_name(raw_name)
+                line = f"o {name}".encode('utf-8') + line[len(line.rstrip(b"\r\n")):]
+                if index:
+                    index.start_group(name, offset)
+            elif mtl_filename and line.startswith(b"mtllib "):
+                line = f"mtllib {mtl_filename}".encode('utf-8') + line[len(line.rstrip(b"\r\n")):]
+            elif index:
+                index.record(line)
+            offset += len(line)
+            pending.append(line)
+            if len(pending) >= WRITE_BUFFER_LINES:
+                dest.write(b"".join(pending))
+                pending.clear()
+        dest.write(b"".join(pending))
+
+    if index:
+        write_group_index(index_path, dest_path, offset, index.finish(offset))
+    return sorted(group_counts.keys())
+
+# === Compaction ===
+# Optional last stage: drops v/vt/vn records nothing references, merges
+# duplicates (after optional quantizing) and rewrites the OBJ with records
+# shared between groups instead of repeated per group. The rewrite goes
+# through the Mesh IR like the native engine's output, so smoothing lines
+# become `s off` (Blockbench models are flat-shaded) and `g` lines are
+# dropped, since only `o` objects are kept.
+def compaction_summary(removed):
+    return (f"removed {removed['positions']} v, {removed['uvs']} vt, {removed['normals']} vn record(s)"
+            + (f" and {removed['faces']} collapsed face(s)" if removed["faces"] else ""))
+
+def compact_obj(obj_path, quantize=None, index_path=None):
+    mesh = Mesh.from_obj(obj_path)
+    removed = compact_records(mesh, quantize)
+    staging = obj_path + ".tmp"
+    mesh.write_obj(staging, header="# Blockbench OBJ Fixer (compacted)\n", index_path=index_path, shared=True)
+    os.replace(staging, obj_path)
+    return removed, mesh.group_names()
+
+# === Cache Key Options ===
+def cleaner_options(engine, enable_hbm):
+    if engine == "native":
+        return {"engine": engine, "engine_version": ENGINE_VERSION, "enable_hbm": bool(enable_hbm)}
+    return {"engine": engine, "engine_version": blender_cleaner.CLEANER_VERSION,
+            "blender_version": blender_version(blender_cleaner.BLENDER_PATH),
+            "enable_hbm": bool(enable_hbm)}
+
+# === Blender Progress and Cancellation ===
+PROGRESS_MESSAGES = {
+    "import_done": "Blender imported {objects} object(s).",
+    "transformed": "Blender applied the HBM transform to {objects} object(s).",
+    "cleaned": "Blender cleaned up the meshes.",
+    "export_done": "Blender exported the cleaned OBJ.",
+}
+
+def describe_progress(event):
+    message = PROGRESS_MESSAGES.get(event["event"], "Blender: " + event["event"])
+    return message.format_map({"objects": "?", **event})
+
+def check_cancelled(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        raise JobCancelled("Cancelled.")
+
 # === Main File Processor ===
 def process_obj_file(input_path, output_dir, java_class=None, logger=print,
-                     generate_txt=False, output_name="model", enable_hbm=False):
+                     generate_txt=False, output_name="model", enable_hbm=False,
+                     engine="blender", cache=None, tracer=None, timeout=None, cancel_event=None,
+                     write_index=False, compact=False, quantize=None):
     if not os.path.isfile(input_path):
         raise FileNotFoundError("File not found: " + input_path)
+    if engine not in ENGINES:
+        raise ValueError("Unknown engine: " + str(engine))
+    tracer = tracer or Tracer()
+    check_cancelled(cancel_event)
 
-    logger("Cleaning model with Blender...")
-    cleaned_path = run_blender_cleaner(input_path, enable_hbm=enable_hbm)
+    # Each job gets its own scratch directory so parallel jobs never collide.
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    scratch_dir = tempfile.mkdtemp(prefix="job_", dir=TEMP_DIR)
+    # Everything the stages need travels in one dict, like batch jobs do, so
+    # adding an option never reshuffles positional parameters.
+    job = {
+        "input_path": input_path,
+        "output_dir": output_dir,
+        "output_name": output_name,
+        "java_class": java_class,
+        "generate_txt": generate_txt,
+        "enable_hbm": enable_hbm,
+        "engine": engine,
+        "timeout": timeout,
+        "cancel_event": cancel_event,
+        "write_index": write_index,
+        "compact": compact,
+        "quantize": quantize,
+        "cache": cache,
+        "logger": logger,
+        "tracer": tracer,
+        "scratch_dir": scratch_dir,
+        "final_path": os.path.join(output_dir, output_name + ".obj"),
+        "final_mtl_name": output_name + ".mtl",
+        "index_path": os.path.join(output_dir, output_name + INDEX_SUFFIX) if write_index else None,
+    }
+    try:
+        group_names = _convert(job)
+    finally:
+        with tracer.span("temp_cleanup"):
+            try:
+                shutil.rmtree(scratch_dir)
+            except Exception as e:
+                logger(f"⚠️ Failed to clean temp folder: {scratch_dir} → {e}")
+    return group_names
+
+def _convert(job):
+    cache, logger, tracer = job["cache"], job["logger"], job["tracer"]
+    key = cached = None
+    if cache is not None:
+        with tracer.span("cache_lookup") as span:
+            key = cache_key(job["input_path"], **cleaner_options(job["engine"], job["enable_hbm"]))
+            # Native entries are memory-mapped straight from the cache; Blender
+            # outputs are copied into the scratch dir for post-processing.
+            cached = cache.lookup(key) if job["engine"] == "native" else cache.restore(key, job["scratch_dir"])
+            span["hit"] = bool(cached)
+        if cached:
+            logger(f"Cache hit: restored {len(cached['groups'])} cached group(s).")
+
+    os.makedirs(job["output_dir"], exist_ok=True)
+    if job["engine"] == "native":
+        group_names = _finish_native(job, key, cached)
+    else:
+        group_names = _finish_blender(job, key, cached)
+
+    logger(f"Final OBJ saved to: {job['final_path']}")
+    if job["index_path"]:
+        logger(f"Group index saved to: {job['index_path']}")
+
+    if job["java_class"]:
+        with tracer.span("write_java") as span:
+            java_path = write_java_class(job["java_class"], group_names, job["output_dir"])
+            span["bytes_written"] = file_size(java_path)
+        logger(f"Java mapping saved to: {java_path}")
+
+    if job["generate_txt"]:
+        with tracer.span("write_txt") as span:
+            txt_path = write_txt_list(group_names, job["output_dir"], job["output_name"])
+            span["bytes_written"] = file_size(txt_path)
+        logger(f"Group list saved to: {txt_path}")
+
+    return group_names
+
+# The native engine parses the input once into the mesh IR, runs every stage
+# on it and serializes only the final OBJ.
+def _store_in_cache(job, key, files, group_names):
+    with job["tracer"].span("cache_store") as span:
+        job["cache"].store(key, files, group_names)
+        span["bytes_written"] = sum(file_size(path) for path in files.values())
+    job["logger"]("Cache miss: stored cleaned model.")
+
+def _finish_native(job, key, cached):
+    logger, tracer, input_path = job["logger"], job["tracer"], job["input_path"]
+    if cached:
+        with tracer.span("cache_load"):
+            mesh = Mesh.load(cached["files"]["mesh.bin"])
+    else:
+        logger("Cleaning model with native engine...")
+        with tracer.span("parse", bytes_read=file_size(input_path)) as span:
+            mesh = Mesh.from_obj(input_path, report=logger)
+            span.update(vertices=len(mesh.positions), faces=len(mesh.face_sizes), groups=len(mesh.groups))
+        check_cancelled(job["cancel_event"])
+        with tracer.span("clean_mesh") as span:
+            mesh = clean_mesh(mesh, job["enable_hbm"], logger)
+            span.update(vertices=len(mesh.positions), faces=len(mesh.face_sizes))
+        check_cancelled(job["cancel_event"])
+
+    # The cache keeps the cleaned IR, before output-specific group renaming.
+    mesh_path = os.path.join(job["scratch_dir"], "mesh.bin")
+    if job["cache"] is not None and not cached:
+        with tracer.span("save_mesh") as span:
+            mesh.save(mesh_path)
+            span["bytes_written"] = file_size(mesh_path)
+
+    if job["compact"]:
+        with tracer.span("compact") as span:
+            before = len(mesh.positions) + len(mesh.uvs) + len(mesh.normals)
+            removed = compact_records(mesh, job["quantize"])
+            span.update(removed)
+        after = len(mesh.positions) + len(mesh.uvs) + len(mesh.normals)
+        logger(f"Compacted records from {before} to {after}: {compaction_summary(removed)}.")
+
+    logger("Deduplicating group names...")
+    with tracer.span("deduplicate") as span:
+        group_names = deduplicate_groups(mesh)
+        span["groups"] = len(group_names)
+    logger(f"Found {len(group_names)} group(s) after processing.")
+    with tracer.span("write_obj") as span:
+        mesh.write_obj(job["final_path"], index_path=job["index_path"], shared=bool(job["compact"]))
+        span["bytes_written"] = file_size(job["final_path"])
+
+    if job["cache"] is not None and not cached:
+        _store_in_cache(job, key, {"mesh.bin": mesh_path}, group_names)
+    return group_names
+
+def _finish_blender(job, key, cached):
+    logger, tracer, input_path, final_path = job["logger"], job["tracer"], job["input_path"], job["final_path"]
+    if cached:
+        cleaned_path = cached["files"]["cleaned.obj"]
+    else:
+        options = {"enable_hbm": job["enable_hbm"], "temp_dir": job["scratch_dir"], "timeout": job["timeout"],
+                   "cancel_event": job["cancel_event"],
+                   "on_progress": lambda event: logger(describe_progress(event))}
+        with tracer.span("blender", bytes_read=file_size(input_path)) as span:
+            if job["engine"] == "worker":
+                logger("Cleaning model with persistent Blender worker...")
+                cleaned_path = run_worker_cleaner(input_path, stats=span, **options)
+            else:
+                logger("Cleaning model with Blender...")
+                cleaned_path = run_blender_cleaner(input_path, stats=span, **options)
+            span["bytes_written"] = file_size(cleaned_path)
 
     if not os.path.exists(cleaned_path):
         raise RuntimeError("Blender failed to generate cleaned OBJ.")
 
     # Attempt to locate the .mtl file that Blender generated
     cleaned_mtl_path = cleaned_path.replace(".obj", ".mtl")
-    final_name = output_name + ".obj"
-    final_path = os.path.join(output_dir, final_name)
-    final_mtl_name = output_name + ".mtl"
-    final_mtl_path = os.path.join(output_dir, final_mtl_name)
+    final_mtl_path = os.path.join(job["output_dir"], job["final_mtl_name"])
+    has_mtl = os.path.exists(cleaned_mtl_path)
 
     logger("Deduplicating group names...")
-    group_names = deduplicate_obj(cleaned_path)
-
+    renamed = {}
+    with tracer.span("postprocess", bytes_read=file_size(cleaned_path)) as span:
+        group_names = postprocess_obj(cleaned_path, final_path, job["final_mtl_name"] if has_mtl else None,
+                                      None if job["compact"] else job["index_path"], renamed)
+        span.update(groups=len(group_names), bytes_written=file_size(final_path))
     logger(f"Found {len(group_names)} group(s) after processing.")
 
-    if os.path.exists(cleaned_mtl_path):
-        update_mtllib_reference(cleaned_path, final_mtl_name)
-        shutil.move(cleaned_mtl_path, final_mtl_path)
-        logger(f"Updated and moved MTL file to: {final_mtl_path}")
-
-    shutil.move(cleaned_path, final_path)
-    logger(f"Final OBJ saved to: {final_path}")
+    if job["compact"]:
+        with tracer.span("compact", bytes_read=file_size(final_path)) as span:
+            removed, kept = compact_obj(final_path, job["quantize"], index_path=job["index_path"])
+            span.update(removed, bytes_written=file_size(final_path))
+        # Quantizing can collapse every face of a group; a base name stays
+        # listed while any of its renamed groups survives. Faces before the
+        # first `o` line come back as a group named after the file, which
+        # postprocess_obj never renamed.
+        group_names = sorted({renamed.get(name, normalize_group_name(name)) for name in kept})
+        logger(f"Compacted OBJ from {span['bytes_read'] / 1e6:.2f} MB to {span['bytes_written'] / 1e6:.2f} MB: "
+               f"{compaction_summary(removed)}.")
 
-    if java_class:
-        java_path = write_java_class(java_class, group_names, output_dir)
-        logger(f"Java mapping saved to: {java_path}")
+    if job["cache"] is not None and not cached:
+        files = {"cleaned.obj": cleaned_path}
+        if has_mtl:
+            files["cleaned.mtl"] = cleaned_mtl_path
+        _store_in_cache(job, key, files, group_names)
 
-    if generate_txt:
-        txt_path = write_txt_list(group_names, output_dir, output_name)
-        logger(f"Group list saved to: {txt_path}")
-
-    for f in os.listdir(TEMP_DIR):
-        try:
-            os.remove(os.path.join(TEMP_DIR, f))
-        except Exception as e:
-            logger(f"⚠️ Failed to clean temp file: {f} → {e}")
+    if has_mtl:
+        with tracer.span("move_mtl"):
+            shutil.move(cleaned_mtl_path, final_mtl_path)
+        logger(f"Updated and moved MTL file to: {final_mtl_path}")
+    return group_names
@@ -0,0 +1,87 @@
+import os
+import json
+
+# === Group Index Sidecar ===
+# <model>.groups.json lists every `o` group of an OBJ with its byte range in
+# the file, so consumers can seek straight to one group instead of parsing the
+# whole model. Record ranges are [first, count] with first 0-based in file
+# order (the OBJ index is first + 1); bbox is [[min x, y, z], [max x, y, z]] or
+# None for a group without positions. In compacted OBJs, where records are
+# shared between groups, the record ranges span what the group references.
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".groups.json"
+RECORD_KINDS = ("vertices", "uvs", "normals", "faces")
+
+def index_path_for(obj_path):
+    return obj_path[:-4] + INDEX_SUFFIX if obj_path.lower().endswith(".obj") else obj_path + INDEX_SUFFIX
+
+def group_entry(name, offset, length, firsts, counts, bbox):
+    entry = {"name": name, "offset": offset, "length": length}
+    for kind, first, count in zip(RECORD_KINDS, firsts, counts):
+        entry[kind] = [int(first), int(count)]
+    entry["bbox"] = bbox
+    return entry
+
+def write_group_index(index_path, obj_path, obj_size, groups):
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": INDEX_VERSION, "obj": os.path.basename(obj_path),
+                   "size": obj_size, "groups": groups}, f, separators=(",", ":"))
+    return index_path
+
+def load_group_index(index_path):
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get("version") != INDEX_VERSION:
+        raise ValueError(f"Unsupported group index version {index.get('version')}: {index_path}")
+    return index
+
+def read_group(obj_path, entry):
+    # Returns the group's OBJ text; its f lines still use file-wide indices.
+    with open(obj_path, 'rb') as f:
+        f.seek(entry["offset"])
+        return f.read(entry["length"]).decode('utf-8')
+
+# === Streaming Builder (for line-by-line writers) ===
+class GroupIndexBuilder:
+    def __init__(self):
+        self.groups = []
+        self.current = None
+        self.counts = [0, 0, 0, 0]  # v, vt, vn, f seen so far in the file
+
+    def start_group(self, name, offset):
+        self._close(offset)
+        self.current = {"name": name, "offset": offset, "firsts": list(self.counts),
+                        "low": [float("inf")] * 3, "high": [float("-inf")] * 3}
+
+    def record(self, line):
+        tag = line[:2]
+        if tag == b"v ":
+            self.counts[0] += 1
+            if self.current is not None:
+                low, high = self.current["low"], self.current["high"]
+                for axis, value in enumerate(line.split()[1:4]):
+                    value = float(value)
+                    if value < low[axis]:
+                        low[axis] = value
+                    if value > high[axis]:
+                        high[axis] = value
+        elif tag == b"vt":
+            self.counts[1] += 1
+        elif tag == b"vn":
+            self.counts[2] += 1
+        elif tag == b"f ":
+            self.counts[3] += 1
+
+    def finish(self, offset):
+        self._close(offset)
+        return self.groups
+
+    def _close(self, offset):
+        current = self.current
+        if current is None:
+            return
+        counts = [now - first for now, first in zip(self.counts, current["firsts"])]
+        bbox = [current["low"], current["high"]] if counts[0] else None
+        self.groups.append(group_entry(current["name"], current["offset"], offset - current["offset"],
+                                       current["firsts"], counts, bbox))
+        self.current = None
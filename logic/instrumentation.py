@@ -0,0 +1,100 @@
+import os
+import json
+import time
+from contextlib import contextmanager
+
+# === Sinks ===
+# A sink is anything with emit(record); records are plain JSON-able dicts.
+class MemorySink:
+    def __init__(self):
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+class JsonLinesSink:
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def emit(self, record):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+
+# === Timed Spans ===
+class Tracer:
+    def __init__(self, sinks=None, **context):
+        self.sinks = list(sinks or [])
+        self.context = context  # copied into every record, e.g. the input path
+        self.spans = []
+
+    @contextmanager
+    def span(self, name, **fields):
+        # The yielded dict can be filled in by the stage (bytes, counts, ...).
+        started, cpu_started = time.perf_counter(), time.process_time()
+        try:
+            yield fields
+        finally:
+            record = dict(self.context, span=name,
+                          seconds=round(time.perf_counter() - started, 6),
+                          cpu_seconds=round(time.process_time() - cpu_started, 6))
+            record.update(fields)
+            self.emit(record)
+
+    def emit(self, record):
+        self.spans.append(record)
+        for sink in self.sinks:
+            sink.emit(record)
+
+def file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+# === Per-File Breakdown ===
+def span_totals(spans):
+    totals = {}
+    for span in spans:
+        totals[span["span"]] = round(totals.get(span["span"], 0.0) + span["seconds"], 6)
+    return totals
+
+def format_breakdown(spans):
+    parts = []
+    for span in spans:
+        text = f"{span['span']} {span['seconds']:.3f}s"
+        if "startup_seconds" in span:
+            text += f" (startup {span['startup_seconds']:.3f}s, work {span['work_seconds']:.3f}s)"
+        parts.append(text)
+    total = sum(span["seconds"] for span in spans)
+    return "Timing: " + " | ".join(parts) + f" | total {total:.3f}s"
+
+# === Profile Capture ===
+# Runs one call under cProfile and tracemalloc and writes <prefix>.prof plus a
+# readable <prefix>_profile.txt with the hottest functions and allocations.
+PROFILE_TOP = 40
+
+def capture_profile(output_prefix, func, *args, **kwargs):
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_prefix)), exist_ok=True)
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        profiler.dump_stats(output_prefix + ".prof")
+        with open(output_prefix + "_profile.txt", 'w', encoding='utf-8') as f:
+            pstats.Stats(profiler, stream=f).sort_stats("cumulative").print_stats(PROFILE_TOP)
+            f.write(f"Peak traced Python memory: {peak / 1e6:.1f} MB\n\nTop allocations:\n")
+            for stat in snapshot.statistics("lineno")[:PROFILE_TOP]:
+                f.write(str(stat) + "\n")
@@ -0,0 +1,212 @@
+import json
+import numpy as np
+
+MESH_MAGIC = b"OBJFXMSH"
+MESH_FORMAT_VERSION = 1
+ARRAY_ALIGN = 64
+ARRAY_FIELDS = (
+    ("positions", np.float64),
+    ("uvs", np.float64),
+    ("normals", np.float64),
+    ("face_sizes", np.int64),
+    ("corners", np.int64),
+)
+
+# === Group Table ===
+class MeshGroup:
+    __slots__ = ("name", "first_face", "face_count")
+
+    def __init__(self, name, first_face, face_count):
+        self.name = name
+        self.first_face = first_face
+        self.face_count = face_count
+
+    def __repr__(self):
+        return f"MeshGroup({self.name!r}, {self.first_face}, {self.face_count})"
+
+# === Array-Backed Mesh IR ===
+class Mesh:
+    def __init__(self, positions=None, uvs=None, normals=None, face_sizes=None,
+                 corners=None, groups=None, mtllib=None, materials=None):
+        self.positions = _empty(positions, np.float64, 3)    # (n, 3)
+        self.uvs = _empty(uvs, np.float64, 2)                # (n, 2)
+        self.normals = _empty(normals, np.float64, 3)        # (n, 3)
+        self.face_sizes = _empty(face_sizes, np.int64, None)  # corners per face
+        self.corners = _empty(corners, np.int64, 3)          # v/vt/vn per corner, 0-based, -1 if absent
+        self.groups = groups or []            # `o` objects
+        self.materials = materials or []      # `usemtl` face ranges
+        self.mtllib = mtllib
+
+    def group_names(self):
+        return [group.name for group in self.groups]
+
+    def face_starts(self):
+        return np.concatenate(([0], np.cumsum(self.face_sizes)))
+
+    # --- OBJ text ---
+    @classmethod
+    def from_obj(cls, obj_path, workers=None, report=None):
+        from logic.obj_parser import parse_obj
+        return parse_obj(obj_path, workers=workers, report=report)
+
+    def write_obj(self, obj_path, header="# Blockbench OBJ Fixer\n", index_path=None, shared=False):
+        write_obj(self, obj_path, header, index_path, shared)
+
+    # --- Binary, memory-mappable ---
+    def save(self, path):
+        header = {"version": MESH_FORMAT_VERSION, "mtllib": self.mtllib,
+                  "groups": _group_rows(self.groups),
+                  "materials": _group_rows(self.materials),
+                  "arrays": {}}
+        offset = 0
+        for name, dtype in ARRAY_FIELDS:
+            array = np.ascontiguousarray(getattr(self, name), dtype=dtype)
+            header["arrays"][name] = {"shape": list(array.shape), "offset": offset}
+            offset += _aligned(array.nbytes)
+
+        encoded = json.dumps(header).encode('utf-8')
+        data_start = _aligned(len(MESH_MAGIC) + 8 + len(encoded))
+        with open(path, 'wb') as f:
+            f.write(MESH_MAGIC)
+            f.write(len(encoded).to_bytes(8, 'little'))
+            f.write(encoded)
+            for name, dtype in ARRAY_FIELDS:
+                f.seek(data_start + header["arrays"][name]["offset"])
+                f.write(np.ascontiguousarray(getattr(self, name), dtype=dtype).tobytes())
+            f.truncate(data_start + offset)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        with open(path, 'rb') as f:
+            if f.read(len(MESH_MAGIC)) != MESH_MAGIC:
+                raise ValueError("Not a mesh file: " + path)
+            header_size = int.from_bytes(f.read(8), 'little')
+            header = json.loads(f.read(header_size).decode('utf-8'))
+        if header["version"] != MESH_FORMAT_VERSION:
+            raise ValueError(f"Unsupported mesh file version {header['version']}: {path}")
+
+        data_start = _aligned(len(MESH_MAGIC) + 8 + header_size)
+        arrays = {}
+        for name, dtype in ARRAY_FIELDS:
+            spec = header["arrays"][name]
+            shape = tuple(spec["shape"])
+            count = int(np.prod(shape))
+            if mmap and count:
+                # Copy-on-write so pipeline stages can modify the arrays in place.
+                arrays[name] = np.memmap(path, dtype=dtype, mode='c', shape=shape,
+                                         offset=data_start + spec["offset"])
+            else:
+                arrays[name] = np.fromfile(path, dtype=dtype, count=count,
+                                           offset=data_start + spec["offset"]).reshape(shape)
+
+        return cls(groups=[MeshGroup(*row) for row in header["groups"]],
+                   materials=[MeshGroup(*row) for row in header.get("materials", [])],
+                   mtllib=header["mtllib"], **arrays)
+
+def _empty(array, dtype, width):
+    if array is None:
+        return np.zeros((0, width) if width else 0, dtype=dtype)
+    return array
+
+def _group_rows(groups):
+    return [[group.name, group.first_face, group.face_count] for group in groups]
+
+def _aligned(size):
+    return (size + ARRAY_ALIGN - 1) // ARRAY_ALIGN * ARRAY_ALIGN
+
+# === OBJ Writer ===
+def _format_rows(tag, fmt, rows):
+    if not len(rows):
+        return ""
+    line = tag + (" " + fmt) * rows.shape[1] + "\n"
+    return (line * len(rows)) % tuple(rows.ravel())
+
+def _format_corner(v, vt, vn):
+    if vn >= 0:
+        return f"{v}/{vt}/{vn}" if vt >= 0 else f"{v}//{vn}"
+    return f"{v}/{vt}" if vt >= 0 else str(v)
+
+RECORD_FORMATS = (("v", "%.6f", "positions"), ("vt", "%.6f", "uvs"), ("vn", "%.4f", "normals"))
+SHARED_WRITE_ROWS = 1 << 16
+
+def _shared_ranges(corners):
+    # In shared files a group's records are not contiguous, so the index gets
+    # the span of records it references.
+    firsts, counts = [], []
+    for axis in range(3):
+        present = corners[:, axis][corners[:, axis] >= 0]
+        low = int(present.min()) if len(present) else 0
+        firsts.append(low)
+        counts.append(int(present.max()) - low + 1 if len(present) else 0)
+    return firsts, counts
+
+def write_obj(mesh, obj_path, header="# Blockbench OBJ Fixer\n", index_path=None, shared=False):
+    # By default each group gets its own block of referenced records, like
+    # Blender's exporter; shared=True writes every record once up front instead,
+    # which is what compacted meshes need.
+    from logic.group_index import group_entry, write_group_index
+    face_starts = mesh.face_starts()
+    offsets = [0, 0, 0]
+    faces_written = 0
+    material_starts = {material.first_face: material.name for material in mesh.materials}
+    entries = []
+
+    with open(obj_path, 'wb') as f:
+        f.write(header.encode('utf-8'))
+        if mesh.mtllib:
+            f.write(f"mtllib {mesh.mtllib}\n".encode('utf-8'))
+        if shared:
+            for tag, fmt, name in RECORD_FORMATS:
+                data = getattr(mesh, name)
+                for start in range(0, len(data), SHARED_WRITE_ROWS):
+                    f.write(_format_rows(tag, fmt, data[start:start + SHARED_WRITE_ROWS]).encode('utf-8'))
+
+        for group in mesh.groups:
+            corners = mesh.corners[face_starts[group.first_face]:face_starts[group.first_face + group.face_count]]
+            chunks = [f"o {group.name}\n"]
+            bbox = None
+
+            if shared:
+                local = np.where(corners >= 0, corners + 1, -1)
+                firsts, counts = _shared_ranges(corners)
+                if index_path and counts[0]:
+                    rows = np.round(mesh.positions[np.unique(corners[:, 0][corners[:, 0] >= 0])], 6)
+                    bbox = [rows.min(axis=0).tolist(), rows.max(axis=0).tolist()]
+            else:
+                local = np.empty_like(corners)
+                firsts = offsets[:]
+                for axis, (tag, fmt, name) in enumerate(RECORD_FORMATS):
+                    used, inverse = np.unique(corners[:, axis], return_inverse=True)
+                    inverse = inverse.reshape(-1)
+                    present = used >= 0
+                    rows = getattr(mesh, name)[used[present]]
+                    chunks.append(_format_rows(tag, fmt, rows))
+                    base = offsets[axis] + 1 - (0 if present.all() else 1)
+                    local[:, axis] = np.where(corners[:, axis] >= 0, inverse + base, -1)
+                    offsets[axis] += int(present.sum())
+                    if axis == 0 and index_path and len(rows):
+                        # Rounded like the written text so the box matches what readers parse.
+                        rows = np.round(rows, 6)
+                        bbox = [rows.min(axis=0).tolist(), rows.max(axis=0).tolist()]
+                counts = [now - first for now, first in zip(offsets, firsts)]
+
+            chunks.append("s off\n")
+            sizes = mesh.face_sizes[group.first_face:group.first_face + group.face_count]
+            tokens = [_format_corner(v, vt, vn) for v, vt, vn in local.tolist()]
+            position = 0
+            for face, size in enumerate(sizes.tolist(), group.first_face):
+                if face in material_starts:
+                    chunks.append(f"usemtl {material_starts[face]}\n")
+                chunks.append("f " + " ".join(tokens[position:position + size]) + "\n")
+                position += size
+
+            data = "".join(chunks).encode('utf-8')
+            if index_path:
+                entries.append(group_entry(group.name, f.tell(), len(data), firsts + [faces_written],
+                                           counts + [group.face_count], bbox))
+            faces_written += group.face_count
+            f.write(data)
+        size = f.tell()
+
+    if index_path:
+        write_group_index(index_path, obj_path, size, entries)
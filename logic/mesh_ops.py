@@ -0,0 +1,250 @@
+import numpy as np
+
+WELD_THRESHOLD = 0.0001
+
+# === Face Filtering ===
+def remap_ranges(ranges, new_start):
+    # new_start[i] is the new index of old face i (with one trailing entry).
+    kept = []
+    for group in ranges:
+        first = int(new_start[group.first_face])
+        count = int(new_start[group.first_face + group.face_count]) - first
+        if count > 0:
+            group.first_face, group.face_count = first, count
+            kept.append(group)
+    return kept
+
+def remap_groups(mesh, new_start):
+    # Every face-range table has to follow the faces, or usemtl switches drift.
+    mesh.groups = remap_ranges(mesh.groups, new_start)
+    mesh.materials = remap_ranges(mesh.materials, new_start)
+
+def keep_faces(mesh, keep):
+    if keep.all():
+        return 0
+    mesh.corners = mesh.corners[np.repeat(keep, mesh.face_sizes)]
+    mesh.face_sizes = mesh.face_sizes[keep]
+
+    remap_groups(mesh, np.concatenate(([0], np.cumsum(keep))))
+    return int((~keep).sum())
+
+def face_size_buckets(face_sizes):
+    # Yields (size, face indices, corner indices as a (faces, size) array).
+    starts = np.concatenate(([0], np.cumsum(face_sizes)[:-1]))
+    for size in np.unique(face_sizes).tolist():
+        faces = np.flatnonzero(face_sizes == size)
+        yield size, faces, starts[faces, None] + np.arange(size)
+
+def drop_degenerate_faces(mesh):
+    # A face survives only if it still has three distinct vertices.
+    keep = np.zeros(len(mesh.face_sizes), dtype=bool)
+    for size, faces, corner_index in face_size_buckets(mesh.face_sizes):
+        verts = np.sort(mesh.corners[corner_index, 0], axis=1)
+        keep[faces] = 1 + (np.diff(verts, axis=1) != 0).sum(axis=1) >= 3
+    return keep_faces(mesh, keep)
+
+# === Spatial-Hash Vertex Welding ===
+HASH_PRIMES = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+
+def grid_keys(positions, threshold):
+    cells = np.floor(positions / threshold + 0.5).astype(np.int64)
+    cells -= cells.min(axis=0)
+    extents = cells.max(axis=0) + 1
+    if float(extents[0]) * float(extents[1]) * float(extents[2]) < 2 ** 62:
+        return (cells[:, 0] * extents[1] + cells[:, 1]) * extents[2] + cells[:, 2], None
+    # Too spread out to pack exactly; hash the cell and keep it for collision checks.
+    hashed = cells * HASH_PRIMES
+    return hashed[:, 0] ^ hashed[:, 1] ^ hashed[:, 2], cells
+
+def weld_vertices(mesh, threshold=WELD_THRESHOLD):
+    count = len(mesh.positions)
+    if count == 0:
+        return 0
+
+    keys, cells = grid_keys(mesh.positions, threshold)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    boundary = np.empty(count, dtype=bool)
+    boundary[0] = True
+    boundary[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    if cells is not None:
+        sorted_cells = cells[order]
+        changed = (sorted_cells[1:] != sorted_cells[:-1]).any(axis=1)
+        if (changed & ~boundary[1:]).any():
+            # Hash collision between different cells: fall back to an exact row sort.
+            order = np.lexsort(cells.T[::-1])
+            sorted_cells = cells[order]
+            boundary[1:] = (sorted_cells[1:] != sorted_cells[:-1]).any(axis=1)
+
+    unique_count = int(boundary.sum())
+    if unique_count == count:
+        return 0
+
+    # Stable sorting makes each run start at its first occurrence; keep those
+    # survivors in their original order.
+    group = np.cumsum(boundary) - 1
+    first = order[boundary]
+    rank = np.empty(unique_count, dtype=np.int64)
+    rank[np.argsort(first)] = np.arange(unique_count)
+    remap = np.empty(count, dtype=np.int64)
+    remap[order] = rank[group]
+
+    mesh.positions = mesh.positions[np.sort(first)]
+    used = mesh.corners[:, 0] >= 0
+    mesh.corners[used, 0] = remap[mesh.corners[used, 0]]
+    drop_degenerate_faces(mesh)
+    return count - unique_count
+
+# === Vectorized Triangulation ===
+QUAD_SPLIT_02 = np.array([[0, 1, 2], [0, 2, 3]])
+QUAD_SPLIT_13 = np.array([[0, 1, 3], [1, 2, 3]])
+
+def fan_pattern(size):
+    k = np.arange(1, size - 1)
+    return np.stack([np.zeros_like(k), k, k + 1], axis=1)
+
+def triangulate(mesh):
+    sizes = mesh.face_sizes
+    if (sizes == 3).all():
+        return 0
+
+    tri_counts = np.maximum(sizes - 2, 0)
+    tri_start = np.concatenate(([0], np.cumsum(tri_counts)))
+    source = np.empty((int(tri_start[-1]), 3), dtype=np.int64)
+
+    for size, faces, corner_index in face_size_buckets(sizes):
+        if size < 3:
+            continue
+        rows = tri_start[faces, None] + np.arange(size - 2)
+        if size == 4:
+            # Split quads along the shorter diagonal, like Blender's beauty method.
+            p = mesh.positions[mesh.corners[corner_index, 0]]
+            split_13 = (((p[:, 1] - p[:, 3]) ** 2).sum(axis=1) <
+                        ((p[:, 0] - p[:, 2]) ** 2).sum(axis=1))
+            pattern = np.where(split_13[:, None, None], QUAD_SPLIT_13, QUAD_SPLIT_02)
+            source[rows] = np.take_along_axis(corner_index[:, None, :].repeat(2, axis=1), pattern, axis=2)
+        else:
+            source[rows] = corner_index[:, fan_pattern(size)]
+
+    mesh.corners = mesh.corners[source.ravel()]
+    mesh.face_sizes = np.full(len(source), 3, dtype=np.int64)
+    remap_groups(mesh, tri_start)
+    return int((sizes > 3).sum())
+
+# === Consistent Outward Winding ===
+def face_adjacency(tris, vertex_count):
+    # Pairs of triangles sharing a manifold edge; relation is 1 when both walk
+    # the shared edge in the same direction, i.e. one of them must be flipped.
+    a = tris.ravel()
+    b = tris[:, [1, 2, 0]].ravel()
+    face = np.repeat(np.arange(len(tris)), 3)
+    keys = np.minimum(a, b) * vertex_count + np.maximum(a, b)
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+
+    same = keys[1:] == keys[:-1]
+    starts = same.copy()
+    starts[1:] &= ~same[:-1]
+    starts[:-1] &= ~same[1:]
+    first = order[:-1][starts]
+    second = order[1:][starts]
+
+    f1, f2 = face[first], face[second]
+    relation = (a[first] == a[second]).astype(np.int8)
+    distinct = f1 != f2
+    f1, f2, relation = f1[distinct], f2[distinct], relation[distinct]
+
+    # Symmetric CSR index over faces
+    u = np.concatenate((f1, f2))
+    v = np.concatenate((f2, f1))
+    rel = np.concatenate((relation, relation))
+    order = np.argsort(u, kind='stable')
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(u, minlength=len(tris)))))
+    return indptr, v[order], rel[order], u[order]
+
+def connected_components(face_count, u, v):
+    labels = np.arange(face_count)
+    while True:
+        new = labels.copy()
+        np.minimum.at(new, u, labels[v])
+        new = new[new]
+        if np.array_equal(new, labels):
+            return labels
+        labels = new
+
+def expand_csr(indptr, frontier):
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(counts)[:-1])), counts)
+    return np.arange(int(counts.sum())) + offsets, np.repeat(frontier, counts)
+
+def orient_faces(mesh):
+    if not len(mesh.face_sizes):
+        return 0
+    tris = mesh.corners[:, 0].reshape(-1, 3)
+    indptr, neighbours, relation, sources = face_adjacency(tris, max(len(mesh.positions), 1))
+    labels = connected_components(len(tris), sources, neighbours)
+
+    # Level-synchronous BFS from one seed per component, all components at once.
+    flip = np.full(len(tris), -1, dtype=np.int8)
+    frontier = np.flatnonzero(labels == np.arange(len(tris)))
+    flip[frontier] = 0
+    while len(frontier):
+        edge, source = expand_csr(indptr, frontier)
+        target = neighbours[edge]
+        wanted = flip[source] ^ relation[edge]
+        fresh = flip[target] < 0
+        target, first = np.unique(target[fresh], return_index=True)
+        flip[target] = wanted[fresh][first]
+        frontier = target
+
+    # Orient each component outward using its signed volume.
+    p = mesh.positions[tris]
+    volume = np.einsum('ij,ij->i', p[:, 0], np.cross(p[:, 1], p[:, 2]))
+    volume = np.where(flip == 1, -volume, volume)
+    inward = np.bincount(labels, weights=volume, minlength=len(tris)) < 0
+    flip = (flip == 1) ^ inward[labels]
+
+    if flip.any():
+        corners = mesh.corners.reshape(-1, 3, 3)
+        corners[flip] = corners[flip][:, [0, 2, 1]]
+        # Flipped faces need their stored normals negated as well.
+        normals = corners[flip][:, :, 2]
+        if len(mesh.normals) and (normals >= 0).any():
+            offset = len(mesh.normals)
+            mesh.normals = np.concatenate((mesh.normals, -mesh.normals))
+            corners[flip, :, 2] = np.where(normals >= 0, normals + offset, -1)
+        mesh.corners = corners.reshape(-1, 3)
+    return int(flip.sum())
+
+# === Record Compaction ===
+# Written precision per record array, matching the OBJ writer's formats.
+RECORD_PRECISION = (("positions", 6), ("uvs", 6), ("normals", 4))
+
+def dedupe_rows(rows):
+    # Returns the distinct rows in first-seen order and each row's new index.
+    rows = np.ascontiguousarray(rows)
+    keys = rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[order] = np.arange(len(first))
+    return rows[first[order]], rank[inverse.reshape(-1)]
+
+def compact_records(mesh, decimals=None):
+    # Drops records no corner references and merges records that are equal once
+    # rounded to the written precision (or to `decimals`, if coarser).
+    removed = {}
+    for axis, (name, precision) in enumerate(RECORD_PRECISION):
+        data = getattr(mesh, name)
+        index = mesh.corners[:, axis]
+        present = index >= 0
+        used, inverse = np.unique(index[present], return_inverse=True)
+        places = precision if decimals is None else min(decimals, precision)
+        # Adding 0.0 folds -0.0 into 0.0 so both hash alike.
+        rows, remap = dedupe_rows(np.round(data[used], places) + 0.0)
+        mesh.corners[present, axis] = remap[inverse.reshape(-1)]
+        setattr(mesh, name, rows)
+        removed[name] = len(data) - len(rows)
+    removed["faces"] = drop_degenerate_faces(mesh) if removed["positions"] else 0
+    return removed
@@ -0,0 +1,81 @@
+import numpy as np
+from logic.mesh_ops import orient_faces, triangulate, weld_vertices
+
+ENGINE_VERSION = "5"
+
+# Blender imports OBJ files Y-up and works Z-up, so the HBM rotations and
+# offsets are expressed in Blender's axes and converted back on export.
+OBJ_TO_BLENDER = np.array([[1.0, 0.0, 0.0],
+                           [0.0, 0.0, -1.0],
+                           [0.0, 1.0, 0.0]])
+BLENDER_TO_OBJ = OBJ_TO_BLENDER.T
+
+HBM_ROTATION = np.diag([-1.0, 1.0, -1.0])  # 180° about X, then 180° about Z
+HBM_SCALE = 16.0
+HBM_OFFSET_Y = 0.4
+HBM_OFFSET_Z = -9.1
+
+# === HBM Transform ===
+def hbm_matrix(positions):
+    # Rotation and scale first, then recenter on the transformed bounds.
+    blender_linear = HBM_SCALE * HBM_ROTATION @ OBJ_TO_BLENDER
+    if len(positions):
+        transformed = positions @ blender_linear.T
+        lo, hi = transformed.min(axis=0), transformed.max(axis=0)
+        offset = np.array([-(lo[0] + hi[0]) / 2,
+                           -(lo[1] + hi[1]) / 2 + HBM_OFFSET_Y,
+                           -lo[2] + HBM_OFFSET_Z])
+    else:
+        offset = np.zeros(3)
+
+    matrix = np.eye(4)
+    matrix[:3, :3] = BLENDER_TO_OBJ @ blender_linear
+    matrix[:3, 3] = BLENDER_TO_OBJ @ offset
+    return matrix
+
+def apply_hbm_transform(mesh):
+    matrix = hbm_matrix(mesh.positions)
+    mesh.positions = mesh.positions @ matrix[:3, :3].T + matrix[:3, 3]
+    if len(mesh.normals):
+        rotation = matrix[:3, :3] / HBM_SCALE
+        normals = mesh.normals @ rotation.T
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        mesh.normals = normals / np.where(lengths == 0, 1.0, lengths)
+    return matrix
+
+# === Blender-Compatible Object Naming ===
+def blender_object_names(names):
+    taken = set()
+    next_suffix = {}
+    result = []
+    for name in names:
+        unique = name
+        suffix = next_suffix.get(name, 1)
+        while unique in taken:
+            unique = f"{name}.{suffix:03d}"
+            suffix += 1
+        next_suffix[name] = suffix
+        taken.add(unique)
+        result.append(unique.replace(" ", "_"))
+    return result
+
+# === Native Cleaning Pipeline ===
+def clean_mesh(mesh, enable_hbm=False, logger=None):
+    if not mesh.groups:
+        raise RuntimeError("No mesh objects found.")
+
+    if enable_hbm:
+        apply_hbm_transform(mesh)
+        merged = weld_vertices(mesh)
+        split = triangulate(mesh)
+        flipped = orient_faces(mesh)
+        if logger:
+            logger(f"Welded {merged} duplicate vertices, triangulated {split} face(s), "
+                   f"flipped {flipped} face(s) for consistent normals.")
+
+    # Match what Blender's exporter produces with use_materials=False.
+    for group, name in zip(mesh.groups, blender_object_names(mesh.group_names())):
+        group.name = name
+    mesh.mtllib = None
+    mesh.materials = []
+    return mesh
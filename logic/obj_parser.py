@@ -0,0 +1,194 @@
+import os
+import mmap
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from logic.mesh import Mesh, MeshGroup
+
+PARALLEL_THRESHOLD = 32 * 1024 * 1024
+# Chunks bound the parser's working set, so peak memory stays close to the
+# size of the final arrays even when parsing serially.
+CHUNK_BYTES = 32 * 1024 * 1024
+
+# === Chunking ===
+def chunk_bounds(obj_path, chunks):
+    size = os.path.getsize(obj_path)
+    if chunks <= 1 or size == 0:
+        return [(0, size)]
+    bounds = [0]
+    with open(obj_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, chunks):
+            cut = mm.find(b"\n", max(bounds[-1], size * i // chunks))
+            if cut < 0:
+                break
+            if cut + 1 > bounds[-1]:
+                bounds.append(cut + 1)
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+# === Chunk Parser (runs inside a pool process) ===
+# Lines are classified and sliced with NumPy over the raw bytes; numbers are
+# converted in C by np.fromstring, so Python only touches the rare o/usemtl
+# records and faces in unusual formats. `g` lines are ignored: the pipeline
+# only keeps `o` objects, as Blender's exporter does.
+KIND_OTHER, KIND_V, KIND_VT, KIND_VN, KIND_F = range(5)
+RECORD_TAGS = ("o", "usemtl", "mtllib")
+
+def _line_table(data):
+    ends = np.flatnonzero(data == ord("\n"))
+    if len(data) and data[-1] != ord("\n"):
+        ends = np.append(ends, len(data))
+    starts = np.concatenate(([0], ends[:-1] + 1)).astype(np.int64)
+    padded = np.concatenate((data, np.zeros(3, dtype=np.uint8)))
+    c0, c1, c2 = padded[starts], padded[starts + 1], padded[starts + 2]
+
+    kinds = np.full(len(starts), KIND_OTHER, dtype=np.int8)
+    space = ord(" ")
+    kinds[(c0 == ord("v")) & (c1 == space)] = KIND_V
+    kinds[(c0 == ord("v")) & (c1 == ord("t")) & (c2 == space)] = KIND_VT
+    kinds[(c0 == ord("v")) & (c1 == ord("n")) & (c2 == space)] = KIND_VN
+    kinds[(c0 == ord("f")) & (c1 == space)] = KIND_F
+    return starts, ends, kinds
+
+def _select_bytes(data, starts, ends, skip):
+    # Concatenates the selected lines (minus their tag) with their newlines.
+    delta = np.zeros(len(data) + 2, dtype=np.int8)
+    delta[starts + skip] = 1
+    delta[ends + 1] = -1
+    inside = np.cumsum(delta[:len(data)], dtype=np.int8).astype(bool)
+    return data[inside]
+
+def _floats(data, starts, ends, skip, width):
+    if not len(starts):
+        return np.zeros((0, width))
+    selected = _select_bytes(data, starts, ends, skip)
+    values = np.fromstring(selected.tobytes(), dtype=np.float64, sep=" ")
+    if len(values) == width * len(starts):
+        return values.reshape(-1, width)
+    # Some records carry extra components (w, vertex colors); keep the first ones.
+    lines = selected.tobytes().decode('utf-8').splitlines()
+    return np.array([line.split()[:width] for line in lines], dtype=np.float64).reshape(-1, width)
+
+def _faces(data, starts, ends):
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64), np.zeros((0, 3), dtype=np.int64)
+    selected = _select_bytes(data, starts, ends, 2)
+    text = selected.tobytes()
+
+    # Fast path: every corner is written as v/vt/vn.
+    # Running slash counts, so a last line without a newline (end == len(data)) works too.
+    running = np.concatenate(([0], np.cumsum(data == ord("/"), dtype=np.int64)))
+    slashes = running[ends] - running[starts]
+    if b"//" not in text and not (slashes % 2).any():
+        selected = selected.copy()
+        selected[selected == ord("/")] = ord(" ")
+        fields = np.fromstring(selected.tobytes(), dtype=np.int64, sep=" ")
+        if len(fields) == 3 * slashes.sum() // 2:
+            return slashes // 2, fields.reshape(-1, 3)
+
+    face_sizes, fields = [], []
+    for line in text.decode('utf-8').splitlines():
+        tokens = line.split()
+        face_sizes.append(len(tokens))
+        for token in tokens:
+            row = [0, 0, 0]
+            for column, value in enumerate(token.split("/")[:3]):
+                if value:
+                    row[column] = int(value)
+            fields.append(row)
+    return np.array(face_sizes, dtype=np.int64), np.array(fields, dtype=np.int64).reshape(-1, 3)
+
+def parse_chunk(obj_path, start, end):
+    with open(obj_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = np.frombuffer(mm[start:end], dtype=np.uint8)
+
+    starts, ends, kinds = _line_table(data)
+    pick = {kind: kinds == kind for kind in (KIND_V, KIND_VT, KIND_VN, KIND_F)}
+    positions = _floats(data, starts[pick[KIND_V]], ends[pick[KIND_V]], 2, 3)
+    uvs = _floats(data, starts[pick[KIND_VT]], ends[pick[KIND_VT]], 3, 2)
+    normals = _floats(data, starts[pick[KIND_VN]], ends[pick[KIND_VN]], 3, 3)
+    face_sizes, fields = _faces(data, starts[pick[KIND_F]], ends[pick[KIND_F]])
+
+    # Records seen before each line, for relative indices and record positions.
+    seen = np.stack([np.cumsum(pick[kind]) for kind in (KIND_V, KIND_VT, KIND_VN)], axis=1)
+    faces_before = np.cumsum(pick[KIND_F]) - pick[KIND_F]
+
+    records = {tag: [] for tag in RECORD_TAGS}
+    first_bytes = {ord(tag[0]) for tag in RECORD_TAGS}
+    for line in np.flatnonzero((kinds == KIND_OTHER) & np.isin(data[np.minimum(starts, len(data) - 1)], list(first_bytes))):
+        tag, _, name = data[starts[line]:ends[line]].tobytes().decode('utf-8').strip().partition(" ")
+        if tag in records:
+            records[tag].append((name.strip(), int(faces_before[line])))
+
+    # Positive indices are absolute; negative ones are relative to the records
+    # seen so far and are made absolute once the chunk's global offsets are known.
+    seen = np.repeat(seen[pick[KIND_F]], face_sizes, axis=0)
+    relative = fields < 0
+    corners = np.where(relative, seen + fields, fields - 1)
+    corners[fields == 0] = -1
+
+    return {
+        "positions": positions,
+        "uvs": uvs,
+        "normals": normals,
+        "face_sizes": face_sizes,
+        "corners": corners,
+        "relative": relative,
+        "records": records,
+    }
+
+# === Merge ===
+def _group_table(starts, face_total, default_name=None):
+    groups = [MeshGroup(name, first, 0) for name, first in starts]
+    if default_name is not None and (not groups or groups[0].first_face > 0) and face_total:
+        groups.insert(0, MeshGroup(default_name, 0, 0))
+    for group, following in zip(groups, groups[1:] + [None]):
+        group.face_count = (following.first_face if following else face_total) - group.first_face
+    return [group for group in groups if group.face_count > 0]
+
+def merge_chunks(results, default_name):
+    bases = np.zeros(3, dtype=np.int64)
+    face_base = 0
+    records = {tag: [] for tag in RECORD_TAGS}
+    for result in results:
+        corners = result["corners"]
+        corners += np.where(result["relative"], bases, 0)
+        del result["relative"]
+        for tag, entries in result["records"].items():
+            records[tag].extend((name, first + face_base) for name, first in entries)
+        bases += [len(result["positions"]), len(result["uvs"]), len(result["normals"])]
+        face_base += len(result["face_sizes"])
+
+    # Concatenate one array at a time, dropping chunk copies as we go.
+    arrays = {}
+    for name in ("positions", "uvs", "normals", "face_sizes", "corners"):
+        arrays[name] = np.concatenate([result.pop(name) for result in results])
+
+    objects = [(name or default_name, first) for name, first in records["o"]]
+    return Mesh(groups=_group_table(objects, face_base, default_name),
+                materials=_group_table(records["usemtl"], face_base),
+                mtllib=records["mtllib"][0][0] if records["mtllib"] else None, **arrays)
+
+# === Public Entry Point ===
+def parse_obj(obj_path, workers=None, report=None):
+    started = time.perf_counter()
+    size = os.path.getsize(obj_path)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if size >= PARALLEL_THRESHOLD else 1
+    bounds = chunk_bounds(obj_path, max(workers, -(-size // CHUNK_BYTES)))
+    workers = max(1, min(workers, len(bounds)))
+
+    if workers == 1:
+        results = [parse_chunk(obj_path, start, end) for start, end in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(parse_chunk, [obj_path] * len(bounds),
+                                    [start for start, _ in bounds], [end for _, end in bounds]))
+
+    mesh = merge_chunks(results, os.path.splitext(os.path.basename(obj_path))[0])
+    if report:
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        report(f"Parsed {size / 1e6:.1f} MB in {elapsed:.2f}s "
+               f"({size / 1e6 / elapsed:.1f} MB/s, {len(bounds)} chunk(s), {workers} worker(s)).")
+    return mesh
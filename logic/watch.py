@@ -0,0 +1,288 @@
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import threading
+from logic.batch import default_workers, format_cache_stats, run_batch, unique_output_dirs
+from logic.conversion_cache import cache_key
+from logic.converter_core import ENGINES, cleaner_options
+from logic.group_index import INDEX_SUFFIX
+
+MANIFEST_NAME = ".objfixer_watch.json"
+MANIFEST_VERSION = 1
+DEFAULT_POLL_SECONDS = 1.0
+DEFAULT_DEBOUNCE_SECONDS = 2.0
+
+# === Helpers ===
+def java_class_name(stem):
+    name = "".join(part[:1].upper() + part[1:] for part in re.split(r"[^0-9A-Za-z]+", stem) if part)
+    return name if name and not name[0].isdigit() else "Model" + name
+
+def scan_inputs(input_dirs, recursive=True):
+    found = {}
+    stack = [os.path.abspath(directory) for directory in input_dirs]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    stack.append(entry.path)
+            elif entry.name.lower().endswith(".obj"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                found[entry.path] = [stat.st_mtime_ns, stat.st_size]
+    return found
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "inputs": {}}
+
+def save_manifest(path, manifest):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    staging = path + ".tmp"
+    with open(staging, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(staging, path)
+
+# === Folder Watcher ===
+# Polls input folders, waits until a file's size and mtime have held still for
+# debounce_seconds, then reconverts it unless its content hash (which includes
+# the conversion options) matches the manifest and its outputs still exist.
+class FolderWatcher:
+    def __init__(self, input_dirs, output_root, manifest_path=None, engine="blender",
+                 enable_hbm=False, generate_txt=False, java=False, write_index=False,
+                 compact=False, quantize=None, cache=None,
+                 poll_seconds=DEFAULT_POLL_SECONDS, debounce_seconds=DEFAULT_DEBOUNCE_SECONDS,
+                 workers=1, recursive=True, logger=print, on_result=None):
+        if engine not in ENGINES:
+            raise ValueError("Unknown engine: " + str(engine))
+        self.input_dirs = list(input_dirs)
+        self.output_root = os.path.abspath(output_root)
+        self.manifest_path = manifest_path or os.path.join(self.output_root, MANIFEST_NAME)
+        self.manifest = load_manifest(self.manifest_path)
+        self.engine = engine
+        self.enable_hbm = enable_hbm
+        self.generate_txt = generate_txt
+        self.java = java
+        self.write_index = write_index
+        self.compact = compact
+        self.quantize = quantize
+        self.cache = cache
+        self.poll_seconds = poll_seconds
+        self.debounce_seconds = debounce_seconds
+        self.workers = workers
+        self.recursive = recursive
+        self.logger = logger
+        self.on_result = on_result
+        self.pending = {}  # path -> (stat, time the stat was first seen)
+
+    def _options(self):
+        return dict(cleaner_options(self.engine, self.enable_hbm),
+                    generate_txt=bool(self.generate_txt), java=bool(self.java),
+                    write_index=bool(self.write_index), compact=bool(self.compact), quantize=self.quantize)
+
+    def _output_dir(self, path, claimed):
+        # An input keeps the folder it was first given; new inputs whose stem
+        # is already in use (a/model.obj, b/model.obj) get model_2, ...
+        entry = self.manifest["inputs"].get(path)
+        if entry and entry.get("output_dir"):
+            return entry["output_dir"]
+        output_dir = unique_output_dirs([path], self.output_root, taken=claimed)[0]
+        claimed.append(output_dir)
+        return output_dir
+
+    def _job(self, path, output_dir):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return {
+            "id": path,
+            "input_path": path,
+            "output_dir": output_dir,
+            "output_name": stem,
+            "java_class": java_class_name(stem) if self.java else None,
+            "generate_txt": self.generate_txt,
+            "enable_hbm": self.enable_hbm,
+            "write_index": self.write_index,
+            "compact": self.compact,
+            "quantize": self.quantize,
+            "engine": self.engine,
+            "cache": self.cache,
+        }
+
+    def _outputs(self, job):
+        names = [job["output_name"] + ".obj", job["output_name"] + ".mtl", job["output_name"] + ".txt",
+                 job["output_name"] + INDEX_SUFFIX]
+        if job["java_class"]:
+            names.append(job["java_class"] + ".java")
+        paths = [os.path.join(job["output_dir"], name) for name in names]
+        return [path for path in paths if os.path.exists(path)]
+
+    def _settled(self, entry):
+        # A failed conversion is only retried once its input changes, not on
+        # every poll.
+        if entry.get("stale"):
+            return False
+        return not entry.get("ok") or all(os.path.exists(path) for path in entry["outputs"])
+
+    def poll(self, now=None):
+        now = time.monotonic() if now is None else now
+        inputs = self.manifest["inputs"]
+        current = scan_inputs(self.input_dirs, self.recursive)
+        changed = False
+
+        for path, entry in inputs.items():
+            if path not in current and not entry.get("stale"):
+                entry["stale"] = True
+                changed = True
+                self.logger(f"⚠️ Input removed, outputs marked stale: {path}")
+        for path in list(self.pending):
+            if path not in current:
+                del self.pending[path]
+
+        ready = []
+        for path, stat in current.items():
+            entry = inputs.get(path)
+            if entry and entry["stat"] == stat and self._settled(entry):
+                self.pending.pop(path, None)
+                continue
+            seen = self.pending.get(path)
+            if seen is None or seen[0] != stat:
+                # Still being written (or just noticed): restart the debounce timer.
+                seen = self.pending[path] = (stat, now)
+                if self.debounce_seconds > 0:
+                    continue
+            if now - seen[1] >= self.debounce_seconds:
+                del self.pending[path]
+                ready.append(path)
+
+        converted = self.rebuild(ready, current) if ready else []
+        if changed or ready:
+            save_manifest(self.manifest_path, self.manifest)
+        return converted
+
+    def rebuild(self, paths, current):
+        inputs = self.manifest["inputs"]
+        options = self._options()
+        jobs = []
+        hashes = {}
+        claimed = [entry["output_dir"] for entry in inputs.values() if entry.get("output_dir")]
+        for path in paths:
+            try:
+                hashes[path] = cache_key(path, **options)
+            except OSError as e:
+                self.logger(f"⚠️ Could not read {path}: {e}")
+                continue
+            entry = inputs.get(path)
+            if entry and entry["hash"] == hashes[path] and self._settled(entry):
+                # Touched but not changed (or still failing): remember the new stat and skip it.
+                entry["stat"] = current[path]
+                self.logger(f"Unchanged, skipped: {path}")
+                continue
+            jobs.append(self._job(path, self._output_dir(path, claimed)))
+
+        converted = []
+        jobs_by_id = {job["id"]: job for job in jobs}
+
+        def job_log(job, message):
+            self.logger(f"[{os.path.basename(job['input_path'])}] {message}")
+
+        def report(result):
+            path = result["input_path"]
+            job = jobs_by_id[result["id"]]
+            if result["ok"]:
+                self.logger(f"[{os.path.basename(path)}] Saved to: {result['output_dir']}")
+                converted.append(path)
+            else:
+                self.logger(f"❌ Error processing {path}: {result['error']}")
+            inputs[path] = {
+                "hash": hashes[path],
+                "stat": current[path],
+                "output_dir": job["output_dir"],
+                "outputs": self._outputs(job) if result["ok"] else [],
+                "ok": result["ok"],
+                "error": result["error"],
+                "groups": len(result["groups"]),
+                "converted_at": time.time(),
+                "stale": False,
+            }
+            if self.on_result:
+                self.on_result(result)
+
+        if jobs:
+            results = run_batch(jobs, workers=self.workers, on_result=report, on_log=job_log)
+            if self.cache is not None:
+                self.logger(format_cache_stats(results))
+        return converted
+
+    def run(self, stop_event=None):
+        stop_event = stop_event or threading.Event()
+        self.logger(f"Watching {', '.join(self.input_dirs)} for OBJ changes...")
+        while not stop_event.is_set():
+            self.poll()
+            stop_event.wait(self.poll_seconds)
+
+# === Command Line ===
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m logic.watch",
+        description="Watch folders of Blockbench OBJ exports and reconvert files as they change.")
+    parser.add_argument("inputs", nargs="+", help="folders to watch")
+    parser.add_argument("-o", "--output-dir", default="output",
+                        help="root for per-model output folders (default: ./output)")
+    parser.add_argument("--manifest", help=f"state file (default: <output-dir>/{MANIFEST_NAME})")
+    parser.add_argument("--engine", choices=ENGINES, default="blender", help="cleaning engine")
+    parser.add_argument("--hbm", action="store_true", help="enable HBM mode")
+    parser.add_argument("--txt", action="store_true", help="write .txt group lists")
+    parser.add_argument("--java", action="store_true", help="write a Java class named after each file")
+    parser.add_argument("--index", action="store_true", help="write a <name>.groups.json group index")
+    parser.add_argument("--compact", action="store_true", help="merge duplicate and drop unused v/vt/vn records")
+    parser.add_argument("--quantize", type=int, metavar="DECIMALS",
+                        help="round records to this many decimals before compacting")
+    parser.add_argument("--cache", action="store_true", help="use the on-disk conversion cache")
+    parser.add_argument("-j", "--jobs", type=int, default=default_workers(), help="parallel conversions")
+    parser.add_argument("--poll", type=float, default=DEFAULT_POLL_SECONDS, help="seconds between scans")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE_SECONDS,
+                        help="seconds a file must stay unchanged before it is converted")
+    parser.add_argument("--no-recursive", action="store_true", help="only watch the top level of each folder")
+    parser.add_argument("--once", action="store_true", help="convert what changed since the last run and exit")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    cache = None
+    if args.cache:
+        from logic.conversion_cache import ConversionCache
+        cache = ConversionCache()
+
+    watcher = FolderWatcher(args.inputs, args.output_dir, manifest_path=args.manifest, engine=args.engine,
+                            enable_hbm=args.hbm, generate_txt=args.txt, java=args.java,
+                            write_index=args.index, compact=args.compact, quantize=args.quantize, cache=cache,
+                            poll_seconds=args.poll, debounce_seconds=0 if args.once else args.debounce,
+                            workers=max(1, args.jobs), recursive=not args.no_recursive,
+                            logger=lambda message: print(message, file=sys.stderr))
+    if args.once:
+        watcher.poll()
+        failed = [path for path, entry in watcher.manifest["inputs"].items()
+                  if not entry.get("stale") and not entry.get("ok")]
+        return 1 if failed else 0
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ import os
 # NOTE: Removed strict blender check
 
 BUNDLED_BLENDER_PATH = os.path.join("tools", "blender-3.6.22-windows-x64", "blender.exe")
+REQUIREMENTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements.txt")
 
 def check_python_version():
     if sys.version_info < (3, 8):
@@ -15,7 +16,7 @@ def check_python_version():
 def install_requirements():
     try:
         print("[INFO] Installing required Python packages...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", REQUIREMENTS_PATH])
         print("[OK] Python packages installed successfully.")
     except subprocess.CalledProcessError:
         print("[ERROR] Failed to install dependencies from requirements.txt.")
@@ -0,0 +1,11 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Tests never run the real Blender: logic/blender_stub.py speaks its protocol
+# and has hang/fail/crash hooks. Set before any logic module reads it.
+STUB_BLENDER = os.path.join(ROOT, "logic", "blender_stub.py")
+os.environ["OBJ_FIXER_BLENDER"] = STUB_BLENDER
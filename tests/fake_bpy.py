@@ -0,0 +1,50 @@
+# Minimal stand-ins for Blender's bpy and addon_utils modules, enough to import
+# logic/blender_script.py and drive its data-level HBM code outside Blender.
+import sys
+import types
+import numpy as np
+
+class FakeVertices:
+    def __init__(self, co):
+        self.co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+
+    def __len__(self):
+        return len(self.co)
+
+    def foreach_get(self, attribute, buffer):
+        assert attribute == "co"
+        buffer[:] = self.co.ravel()
+
+class FakeMesh:
+    def __init__(self, co):
+        self.vertices = FakeVertices(co)
+
+    def transform(self, matrix):
+        matrix = np.asarray(matrix, dtype=np.float64)
+        self.vertices.co = self.vertices.co @ matrix[:3, :3].T + matrix[:3, 3]
+
+    def update(self):
+        pass
+
+class FakeObject:
+    type = 'MESH'
+
+    def __init__(self, co, matrix_world=None):
+        self.data = FakeMesh(co)
+        self.matrix_world = np.identity(4).tolist() if matrix_world is None else matrix_world
+
+    def world_coordinates(self):
+        matrix = np.asarray(self.matrix_world, dtype=np.float64)
+        return self.data.vertices.co @ matrix[:3, :3].T + matrix[:3, 3]
+
+def install():
+    # Registers the fakes unless a real (or earlier fake) bpy is already loaded.
+    if "bpy" not in sys.modules:
+        bpy = types.ModuleType("bpy")
+        bpy.ops = types.SimpleNamespace()
+        bpy.context = types.SimpleNamespace()
+        sys.modules["bpy"] = bpy
+    if "addon_utils" not in sys.modules:
+        addon_utils = types.ModuleType("addon_utils")
+        addon_utils.enable = lambda name: None
+        sys.modules["addon_utils"] = addon_utils
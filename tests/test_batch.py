@@ -0,0 +1,30 @@
+import time
+import pytest
+from logic.batch import run_batch
+
+MODEL = "o cube\nv 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n"
+
+def write_model(folder, name):
+    path = folder / name
+    path.write_text(MODEL, encoding='utf-8')
+    return str(path)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_progress_reaches_caller_while_job_runs(tmp_path, workers):
+    hang = write_model(tmp_path, "hang.obj")
+    jobs = [{"id": 0, "input_path": hang, "output_dir": str(tmp_path / "hang"), "timeout": 2},
+            {"id": 1, "input_path": write_model(tmp_path, "model.obj"), "output_dir": str(tmp_path / "model")}]
+    seen = {}
+
+    def on_log(job, message):
+        seen.setdefault((job["id"], message), time.monotonic())
+
+    def on_result(result):
+        seen[(result["id"], "result")] = time.monotonic()
+
+    results = run_batch(jobs, workers=workers, on_result=on_result, on_log=on_log)
+    assert sorted(result["ok"] for result in results) == [False, True]
+    # The stub reports import_done right away, then hangs until the timeout.
+    imported = seen[(0, "Blender imported 0 object(s).")]
+    assert seen[(0, "result")] - imported > 1.0
+    assert (1, "Blender exported the cleaned OBJ.") in seen
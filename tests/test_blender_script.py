@@ -0,0 +1,70 @@
+import math
+import numpy as np
+import fake_bpy
+
+fake_bpy.install()
+from logic import blender_script  # noqa: E402
+
+def rotation(axis, angle):
+    c, s = math.cos(angle), math.sin(angle)
+    i, j = [(1, 2), (0, 2), (0, 1)][axis]
+    matrix = np.identity(3)
+    matrix[i, i] = matrix[j, j] = c
+    matrix[i, j], matrix[j, i] = -s, s
+    return matrix
+
+def operator_hbm(objects):
+    # The previous implementation, step by step: per object rotate 180° about
+    # X, then Z, resize by 16 around its origin and apply the transform; then
+    # translate everything by one offset computed from the combined bounds.
+    baked = []
+    for obj in objects:
+        world = np.asarray(obj.matrix_world, dtype=np.float64)
+        linear = world[:3, :3]
+        for step in (rotation(0, math.pi), rotation(2, math.pi), np.diag([16.0] * 3)):
+            linear = step @ linear
+        baked.append(obj.data.vertices.co @ linear.T + world[:3, 3])
+    points = np.concatenate(baked)
+    low, high = points.min(axis=0), points.max(axis=0)
+    offset = np.array([-(low[0] + high[0]) / 2, -(low[1] + high[1]) / 2 + 0.4, -low[2] - 9.1])
+    return [co + offset for co in baked]
+
+def translation(x, y, z):
+    matrix = np.identity(4)
+    matrix[:3, 3] = (x, y, z)
+    return matrix.tolist()
+
+def sample_objects():
+    cube = [[x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)]
+    turned = np.identity(4)
+    turned[:3, :3] = rotation(2, math.pi / 2) * 0.5
+    turned[:3, 3] = (3.0, -1.0, 2.0)
+    return [
+        fake_bpy.FakeObject(cube),
+        fake_bpy.FakeObject(np.array(cube) * 2.0 - 1.0, translation(0.5, 4.0, -2.0)),
+        fake_bpy.FakeObject(cube, turned.tolist()),
+        fake_bpy.FakeObject([]),
+    ]
+
+def test_hbm_matrices_match_operator_semantics():
+    objects = sample_objects()
+    expected = operator_hbm(objects)
+    for obj, matrix, points in zip(objects, blender_script.hbm_matrices(objects), expected):
+        co = obj.data.vertices.co
+        np.testing.assert_allclose(co @ matrix[:3, :3].T + matrix[:3, 3], points, atol=1e-4)
+
+def test_apply_hbm_bakes_into_mesh_data():
+    objects = sample_objects()
+    expected = operator_hbm(objects)
+    blender_script.apply_hbm(objects)
+    for obj, points in zip(objects, expected):
+        np.testing.assert_allclose(np.asarray(obj.matrix_world), np.identity(4))
+        np.testing.assert_allclose(obj.world_coordinates(), points, atol=1e-4)
+
+def test_hbm_floor_and_centre():
+    objects = sample_objects()
+    blender_script.apply_hbm(objects)
+    points = np.concatenate([obj.world_coordinates() for obj in objects])
+    low, high = points.min(axis=0), points.max(axis=0)
+    np.testing.assert_allclose((low[:2] + high[:2]) / 2, [0.0, 0.4], atol=1e-4)
+    np.testing.assert_allclose(low[2], -9.1, atol=1e-4)
@@ -0,0 +1,89 @@
+import os
+import threading
+import pytest
+from logic.blender_cleaner import BlenderTimeout, JobCancelled
+from logic.blender_worker import BlenderWorker
+
+STUB_BLENDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logic", "blender_stub.py")
+MODEL = "o cube\nv 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n"
+
+@pytest.fixture
+def worker():
+    worker = BlenderWorker(blender_path=STUB_BLENDER)
+    yield worker
+    worker.close()
+
+@pytest.fixture
+def models(tmp_path):
+    # The stub picks its behaviour from the input's name.
+    paths = {}
+    for name in ("model", "crash", "hang", "fail"):
+        paths[name] = str(tmp_path / f"{name}.obj")
+        with open(paths[name], 'w', encoding='utf-8') as f:
+            f.write(MODEL)
+    return paths
+
+def convert(worker, path, **options):
+    output = path[:-4] + "_cleaned.obj"
+    result = worker.convert(path, output, **options)
+    assert result["ok"] and os.path.exists(output)
+    return result
+
+def test_jobs_share_one_process(worker, models):
+    convert(worker, models["model"])
+    pid = worker.process.pid
+    convert(worker, models["model"])
+    assert worker.process.pid == pid and worker.restarts == 0
+
+def test_crash_restarts_up_to_retry_limit(worker, models):
+    convert(worker, models["model"])
+    with pytest.raises(RuntimeError, match="crashed while converting"):
+        convert(worker, models["crash"])
+    # The first crash is retried once on a fresh process, then the job fails.
+    assert worker.restarts == worker.retries + 1 == 2
+    convert(worker, models["model"])
+
+def test_retry_limit_is_configurable(models):
+    worker = BlenderWorker(blender_path=STUB_BLENDER, retries=0)
+    try:
+        with pytest.raises(RuntimeError, match="crashed while converting"):
+            convert(worker, models["crash"])
+        assert worker.restarts == 1
+    finally:
+        worker.close()
+
+def test_timeout_kills_worker_and_next_job_succeeds(worker, models):
+    with pytest.raises(BlenderTimeout, match="timed out after 1s"):
+        convert(worker, models["hang"], timeout=1)
+    assert not worker.alive()
+    convert(worker, models["model"])
+
+def test_cancel_kills_worker_and_next_job_succeeds(worker, models):
+    cancel_event = threading.Event()
+    threading.Timer(0.5, cancel_event.set).start()
+    with pytest.raises(JobCancelled):
+        convert(worker, models["hang"], cancel_event=cancel_event)
+    assert not worker.alive()
+    convert(worker, models["model"])
+
+def test_failed_reply_keeps_worker_and_reports_stderr(worker, models):
+    convert(worker, models["model"])
+    pid = worker.process.pid
+    with pytest.raises(RuntimeError, match="Blender worker failed: Stub failure") as failure:
+        convert(worker, models["fail"])
+    assert "stub failure for" in str(failure.value)
+    # A failed job does not take the process down.
+    convert(worker, models["model"])
+    assert worker.process.pid == pid
+
+def test_stderr_is_not_carried_into_the_next_job(worker, models):
+    with pytest.raises(RuntimeError):
+        convert(worker, models["fail"])
+    with pytest.raises(BlenderTimeout) as timeout:
+        convert(worker, models["hang"], timeout=1)
+    assert "stub failure" not in str(timeout.value)
+
+def test_progress_events_reach_the_caller(worker, models):
+    events = []
+    convert(worker, models["model"], on_progress=events.append)
+    assert [event["event"] for event in events] == ["import_done", "export_done"]
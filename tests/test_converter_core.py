@@ -0,0 +1,19 @@
+import pytest
+from logic.converter_core import process_obj_file
+
+# Faces before the first `o` line, then a Blender-style duplicate suffix.
+MODEL = "v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\no b.001\nv 0 0 1\nf 1 2 4\n"
+
+def group_lines(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.split(" ", 1)[1].strip() for line in f if line.startswith("o ")]
+
+@pytest.mark.parametrize("engine", ["blender", "native"])
+def test_compact_lists_faces_before_first_object(tmp_path, engine):
+    model = tmp_path / "model.obj"
+    model.write_text(MODEL, encoding='utf-8')
+    output = tmp_path / "out"
+    groups = process_obj_file(str(model), str(output), logger=lambda message: None,
+                              output_name="model", engine=engine, compact=True)
+    assert groups == sorted(group_lines(output / "model.obj"))
+    assert "b_001" in groups
@@ -0,0 +1,105 @@
+import itertools
+import numpy as np
+import fake_bpy
+from logic.mesh import Mesh, MeshGroup
+from logic.mesh_ops import triangulate
+from logic.native_engine import BLENDER_TO_OBJ, OBJ_TO_BLENDER, apply_hbm_transform, clean_mesh
+
+fake_bpy.install()
+from logic import blender_script  # noqa: E402
+
+def box(low, size):
+    return np.array([[low[i] + corner[i] * size[i] for i in range(3)]
+                     for corner in itertools.product((0.0, 1.0), repeat=3)])
+
+def sample_groups():
+    return [box((-0.5, 0.0, -0.5), (1.0, 0.5, 1.0)),
+            box((0.25, 0.5, -0.125), (0.25, 0.75, 0.25)),
+            box((-1.0, 0.1, 0.3), (0.125, 0.125, 1.5))]
+
+def to_4x4(linear):
+    matrix = np.identity(4)
+    matrix[:3, :3] = linear
+    return matrix.tolist()
+
+def blender_hbm(groups, axis_in_matrix):
+    # Blender imports the OBJ Y-up into its Z-up world, either baked into the
+    # vertices or left on the object; export maps the result back.
+    if axis_in_matrix:
+        objects = [fake_bpy.FakeObject(points, to_4x4(OBJ_TO_BLENDER)) for points in groups]
+    else:
+        objects = [fake_bpy.FakeObject(points @ OBJ_TO_BLENDER.T) for points in groups]
+    blender_script.apply_hbm(objects)
+    return np.concatenate([obj.world_coordinates() for obj in objects]) @ BLENDER_TO_OBJ.T
+
+def test_hbm_transform_matches_blender_script():
+    groups = sample_groups()
+    mesh = Mesh(positions=np.concatenate(groups))
+    apply_hbm_transform(mesh)
+    for axis_in_matrix in (False, True):
+        np.testing.assert_allclose(mesh.positions, blender_hbm(groups, axis_in_matrix), atol=1e-5)
+
+# === Weld, Triangulate and Orient ===
+def cube_quads():
+    # Outward-wound quads of the unit cube, each with its own four positions
+    # as Blockbench exports them.
+    corners = box((0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
+    quads = []
+    for axis in range(3):
+        for side in (0.0, 1.0):
+            face = np.flatnonzero(corners[:, axis] == side)
+            others = [i for i in range(3) if i != axis]
+            centre = corners[face].mean(axis=0)
+            angles = np.arctan2(*(corners[face][:, others] - centre[others]).T[::-1])
+            quad = corners[face[np.argsort(angles)]]
+            normal = np.cross(quad[1] - quad[0], quad[2] - quad[0])
+            if np.dot(normal, centre - 0.5) < 0:
+                quad = quad[::-1]
+            quads.append(quad)
+    return quads
+
+def cube_mesh(reversed_faces):
+    positions, normals, corners = [], [], []
+    for face, quad in enumerate(cube_quads()):
+        normal = np.cross(quad[1] - quad[0], quad[2] - quad[0])
+        if face in reversed_faces:
+            # Wound inward, with a matching inward normal.
+            quad, normal = quad[::-1], -normal
+        positions.extend(quad)
+        normals.append(normal / np.linalg.norm(normal))
+        corners.extend([len(positions) - 4 + k, -1, face] for k in range(4))
+    return Mesh(positions=np.array(positions), normals=np.array(normals),
+                face_sizes=np.full(6, 4), corners=np.array(corners),
+                groups=[MeshGroup("lid", 0, 2), MeshGroup("body", 2, 4)],
+                materials=[MeshGroup("a", 0, 3), MeshGroup("b", 3, 3)])
+
+def test_hbm_pipeline_welds_triangulates_and_orients():
+    mesh = cube_mesh(reversed_faces={1, 4})
+    messages = []
+    clean_mesh(mesh, enable_hbm=True, logger=messages.append)
+    assert messages == ["Welded 16 duplicate vertices, triangulated 6 face(s), "
+                        "flipped 4 face(s) for consistent normals."]
+
+    assert len(mesh.positions) == 8
+    assert mesh.face_sizes.tolist() == [3] * 12
+    tris = mesh.corners[:, 0].reshape(-1, 3)
+    # Closed and consistently wound: every edge is walked once each way.
+    edges = [(a, b) for tri in tris.tolist() for a, b in zip(tri, tri[1:] + tri[:1])]
+    assert len(set(edges)) == 36 and all((b, a) in set(edges) for a, b in edges)
+
+    # Outward: positive volume, and stored normals agree with the winding.
+    p = mesh.positions[tris]
+    assert np.einsum('ij,ij->i', p[:, 0], np.cross(p[:, 1], p[:, 2])).sum() > 0
+    geometric = np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0])
+    stored = mesh.normals[mesh.corners[:, 2].reshape(-1, 3)[:, 0]]
+    assert (np.einsum('ij,ij->i', geometric, stored) > 0).all()
+
+    # Face ranges follow the split into triangles; materials are dropped as
+    # Blender exports with use_materials=False.
+    assert [(g.first_face, g.face_count) for g in mesh.groups] == [(0, 4), (4, 8)]
+    assert mesh.materials == []
+
+def test_triangulate_keeps_material_ranges():
+    mesh = cube_mesh(reversed_faces=())
+    triangulate(mesh)
+    assert [(g.first_face, g.face_count) for g in mesh.materials] == [(0, 6), (6, 6)]
@@ -0,0 +1,50 @@
+import numpy as np
+from logic.obj_parser import parse_obj
+
+def write(path, text):
+    path.write_bytes(text.encode('utf-8'))
+    return str(path)
+
+def quads(count, relative):
+    # One quad per object, each with its own v/vt/vn records.
+    lines = []
+    for i in range(count):
+        lines += [f"o part.{i}", "usemtl m" + str(i % 2)]
+        lines += [f"v {x} {y} {i}" for x, y in ((0, 0), (1, 0), (1, 1), (0, 1))]
+        lines += ["vt 0 0", "vt 1 1", "vn 0 0 1"]
+        if relative:
+            corners = [f"{k - 4}/{-1 - k % 2}/-1" for k in range(4)]
+        else:
+            corners = [f"{4 * i + k + 1}/{2 * i + 1 + (k + 1) % 2}/{i + 1}" for k in range(4)]
+        lines.append("f " + " ".join(corners))
+    return "\n".join(lines) + "\n"
+
+def assert_same_mesh(mesh, other):
+    for name in ("positions", "uvs", "normals", "face_sizes", "corners"):
+        np.testing.assert_array_equal(getattr(mesh, name), getattr(other, name))
+    assert repr(mesh.groups) == repr(other.groups)
+    assert repr(mesh.materials) == repr(other.materials)
+
+def test_last_face_without_newline(tmp_path):
+    path = write(tmp_path / "model.obj", "o a\nv 0 0 0\nv 1 0 0\nv 0 1 0\nvt 0 0\nvn 0 0 1\nf 1/1/1 2/1/1 3/1/1")
+    mesh = parse_obj(path)
+    assert mesh.face_sizes.tolist() == [3]
+    assert mesh.corners.tolist() == [[0, 0, 0], [1, 0, 0], [2, 0, 0]]
+
+def test_last_face_without_newline_slow_path(tmp_path):
+    path = write(tmp_path / "model.obj", "v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3")
+    mesh = parse_obj(path)
+    assert mesh.corners.tolist() == [[0, -1, -1], [1, -1, -1], [2, -1, -1]]
+    assert repr(mesh.groups) == "[MeshGroup('model', 0, 1)]"
+
+def test_relative_indices_match_absolute(tmp_path):
+    relative = parse_obj(write(tmp_path / "relative.obj", quads(50, True)))
+    absolute = parse_obj(write(tmp_path / "absolute.obj", quads(50, False)))
+    assert_same_mesh(relative, absolute)
+
+def test_parallel_parse_matches_serial(tmp_path):
+    # Chunk cuts land mid-model, so negative indices cross chunk boundaries.
+    path = write(tmp_path / "model.obj", quads(50, True))
+    serial = parse_obj(path, workers=1)
+    for workers in (2, 3):
+        assert_same_mesh(parse_obj(path, workers=workers), serial)
@@ -0,0 +1,33 @@
+import os
+import sys
+import json
+import subprocess
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("tkinterdnd2")
+
+# Runs in a fresh interpreter so module import costs are not already paid.
+STARTUP_PROBE = """
+import json, time
+started = time.perf_counter()
+import main
+main.load_fingerprint() == main.environment_fingerprint()
+import gui_app
+print(json.dumps({"seconds": time.perf_counter() - started, "budget": main.STARTUP_BUDGET_SECONDS}))
+"""
+
+def test_startup_fits_budget():
+    output = subprocess.run([sys.executable, "-c", STARTUP_PROBE], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    assert result["seconds"] <= result["budget"], result
+
+def test_gui_import_is_lazy():
+    # Heavy logic modules are imported when first used, not at startup.
+    probe = "import sys, gui_app; print(sorted(m for m in sys.modules if m.startswith('logic.')))"
+    output = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout
+    assert "logic.converter_core" not in output